@@ -30,49 +30,80 @@ Example:
         return {"statusCode": 200}
 """
 
+import importlib
+from typing import Any
+
 __version__ = "0.1.0"
 
 # Core exports - always available (zero dependencies)
-from .handlers.decorators import lambda_handler
+from .handlers.decorators import lambda_handler, with_config, with_database
 from .handlers.protocols import LambdaHandler
 
+# Optional exports, resolved lazily via PEP 562 so that importing the package
+# for a bare @lambda_handler does not drag sqlalchemy/pydantic into cold start.
+# Each name maps to the submodule it is re-exported from.
+_LAZY_EXPORTS = {
+    "get_db_session": "async_aws_lambda.database",
+    "init_db": "async_aws_lambda.database",
+    "close_db": "async_aws_lambda.database",
+    "Base": "async_aws_lambda.database",
+    "get_settings": "async_aws_lambda.config",
+    "Settings": "async_aws_lambda.config",
+    "ErrorHandler": "async_aws_lambda.errors",
+    "ProcessingError": "async_aws_lambda.errors",
+    "ProcessingResult": "async_aws_lambda.errors",
+}
+
+# Feature flags, also resolved lazily (importing the submodule is what
+# determines whether its optional dependencies are installed)
+_FEATURE_FLAGS = {
+    "HAS_DATABASE": "async_aws_lambda.database",
+    "HAS_CONFIG": "async_aws_lambda.config",
+    "HAS_ERRORS": "async_aws_lambda.errors",
+}
+
+# Extras install hint per optional submodule, used when the submodule
+# imports but its optional dependencies are missing
+_EXTRA_HINTS = {
+    "async_aws_lambda.database": "db",
+    "async_aws_lambda.config": "config",
+}
+
+# Only the always-available names: a star-import must keep working without
+# the optional extras installed, so the lazy exports stay out of __all__
 __all__ = [
     "lambda_handler",
     "LambdaHandler",
+    "with_database",
+    "with_config",
 ]
 
-# Optional exports - decorators are always available (raise ImportError if deps missing)
-try:
-    from .handlers.decorators import with_database
-    __all__.append("with_database")
-except ImportError:
-    pass
-
-try:
-    from .handlers.decorators import with_config
-    __all__.append("with_config")
-except ImportError:
-    pass
-
-# Optional module exports
-try:
-    from .database import get_db_session, init_db, close_db, Base
-    __all__.extend(["get_db_session", "init_db", "close_db", "Base"])
-    HAS_DATABASE = True
-except ImportError:
-    HAS_DATABASE = False
-
-try:
-    from .config import get_settings, Settings
-    __all__.extend(["get_settings", "Settings"])
-    HAS_CONFIG = True
-except ImportError:
-    HAS_CONFIG = False
-
-try:
-    from .errors import ErrorHandler, ProcessingError, ProcessingResult
-    __all__.extend(["ErrorHandler", "ProcessingError", "ProcessingResult"])
-    HAS_ERRORS = True
-except ImportError:
-    HAS_ERRORS = False
 
+def __getattr__(name: str) -> Any:
+    """Resolve optional exports on first access (PEP 562)."""
+    if name in _LAZY_EXPORTS:
+        target = _LAZY_EXPORTS[name]
+        module = importlib.import_module(target)
+        try:
+            value = getattr(module, name)
+        except AttributeError:
+            # The submodule imported but swallowed a missing optional
+            # dependency; point at the extra instead of a bare AttributeError
+            extra = _EXTRA_HINTS.get(target, "all")
+            raise ImportError(
+                f"{name!r} requires optional dependencies that are not "
+                f"installed. Install with: pip install async-aws-lambda[{extra}]"
+            ) from None
+        # Cache so subsequent accesses skip this hook
+        globals()[name] = value
+        return value
+    if name in _FEATURE_FLAGS:
+        try:
+            module = importlib.import_module(_FEATURE_FLAGS[name])
+        except ImportError:
+            value = False
+        else:
+            value = getattr(module, name, True)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
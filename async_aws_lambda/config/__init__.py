@@ -10,13 +10,22 @@ This module provides optional configuration management with support for:
 # Try to import config functionality (requires pydantic)
 try:
     from .settings import Settings, get_settings
-    from .secrets import get_secret_from_aws, SecretsBackend
+    from .secrets import (
+        get_secret,
+        get_secret_from_aws,
+        get_secret_from_extension,
+        get_secrets_from_aws,
+        SecretsBackend,
+    )
 
     HAS_CONFIG = True
     __all__ = [
         "Settings",
         "get_settings",
+        "get_secret",
         "get_secret_from_aws",
+        "get_secret_from_extension",
+        "get_secrets_from_aws",
         "SecretsBackend",
     ]
 except ImportError:
@@ -1,21 +1,187 @@
 """
 AWS Secrets Manager integration for Lambda configuration.
 
-This module provides utilities for fetching secrets from AWS Secrets Manager.
-Requires boto3 to be installed.
+This module provides utilities for fetching secrets from AWS Secrets Manager,
+either via boto3 or via the AWS Parameters and Secrets Lambda Extension.
+The extension backend is zero-dependency; the boto3 backend requires boto3.
 """
 
 import json
 import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import OrderedDict
 from typing import Any, Protocol
 
 try:
-    import boto3.session
-    from botocore.exceptions import ClientError
+    # orjson decodes typical config payloads several times faster than the
+    # stdlib parser; it stays optional like every other extra in this package
+    import orjson
 
-    HAS_BOTO3 = True
+    _json_loads = orjson.loads
 except ImportError:
-    HAS_BOTO3 = False
+    _json_loads = json.loads
+
+# boto3 and botocore are imported lazily: their import costs hundreds of
+# milliseconds of cold-start CPU, and apps using only Settings or the
+# extension backend should never pay it. The resolved modules are cached in
+# these globals on first use.
+_boto3: Any = None
+_botocore_config: Any = None
+_ClientError: Any = None
+
+
+def _load_boto3() -> bool:
+    """Import boto3 on first use and cache the resolved modules."""
+    global _boto3, _botocore_config, _ClientError
+    if _boto3 is not None:
+        return True
+    try:
+        import boto3.session
+        import botocore.config
+        from botocore.exceptions import ClientError
+    except ImportError:
+        return False
+    _boto3 = boto3
+    _botocore_config = botocore.config
+    _ClientError = ClientError
+    return True
+
+
+# Cached Secrets Manager clients, keyed by region. Lambda containers persist
+# module globals across warm invocations, so reusing clients avoids repeating
+# the TCP/TLS handshake and botocore service-model load on every call. All
+# clients share a single boto3 session so the credential-resolution chain and
+# ~/.aws config files are only processed once per container.
+_session: Any | None = None
+_clients: dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+# TTL-bounded memoization of fetched secrets. Secrets rarely change within a
+# container's lifetime, so caching converts a network round trip per call into
+# a dict lookup on warm invocations. TTL defaults to 300s (matching the
+# database pool_recycle) and is configurable via SECRETS_CACHE_TTL_SECONDS.
+_secret_cache: dict[tuple[str, str | None, str | None], tuple[float, str]] = {}
+_secret_cache_lock = threading.Lock()
+_DEFAULT_CACHE_TTL_SECONDS = 300.0
+
+# LRU-bounded cache of parsed JSON SecretStrings, keyed by (name, VersionId).
+# A secret fetched once is typically read for several keys (url, password,
+# host...); caching the parsed dict means json.loads runs once per secret
+# version instead of once per key. _NOT_JSON marks plain-string secrets so
+# they skip the parser on later reads too.
+_NOT_JSON: Any = object()
+_parsed_cache: "OrderedDict[tuple[str, str], Any]" = OrderedDict()
+_parsed_cache_lock = threading.Lock()
+_PARSED_CACHE_MAX = 64
+
+
+def _parse_secret_json(name: str, version_id: str, secret_value: str) -> Any:
+    """
+    Parse a JSON SecretString once per secret version.
+
+    Args:
+        name: Secret name
+        version_id: VersionId from the GetSecretValue response
+        secret_value: Raw SecretString payload
+
+    Returns:
+        The parsed JSON value, or _NOT_JSON if the payload is not JSON
+    """
+    cache_key = (name, version_id)
+    with _parsed_cache_lock:
+        parsed = _parsed_cache.get(cache_key)
+        if parsed is not None:
+            _parsed_cache.move_to_end(cache_key)
+            return parsed
+
+    stripped = secret_value.lstrip()
+    if stripped[:1] in ("{", "["):
+        try:
+            parsed = _json_loads(stripped)
+        except ValueError:
+            parsed = _NOT_JSON
+    else:
+        parsed = _NOT_JSON
+
+    with _parsed_cache_lock:
+        _parsed_cache[cache_key] = parsed
+        if len(_parsed_cache) > _PARSED_CACHE_MAX:
+            _parsed_cache.popitem(last=False)
+    return parsed
+
+
+def _cache_ttl() -> float:
+    """Get the secret cache TTL in seconds from the environment."""
+    try:
+        return float(
+            os.environ.get("SECRETS_CACHE_TTL_SECONDS", _DEFAULT_CACHE_TTL_SECONDS)
+        )
+    except ValueError:
+        return _DEFAULT_CACHE_TTL_SECONDS
+
+
+def _get_client(region_name: str) -> Any:
+    """
+    Get a cached Secrets Manager client for the given region.
+
+    Clients are created once per region and reused across invocations.
+    boto3 clients are thread-safe, so sharing them is safe; the lock only
+    guards cache population.
+
+    Args:
+        region_name: AWS region for the client
+
+    Returns:
+        Cached boto3 secretsmanager client
+    """
+    global _session
+
+    client = _clients.get(region_name)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(region_name)
+            if client is None:
+                if _session is None:
+                    _session = _boto3.session.Session()
+                client = _session.client(
+                    service_name="secretsmanager",
+                    region_name=region_name,
+                    config=_botocore_config.Config(
+                        max_pool_connections=10,
+                        tcp_keepalive=True,
+                        retries={"mode": "adaptive", "max_attempts": 3},
+                    ),
+                )
+                _clients[region_name] = client
+    return client
+
+
+def _extract_key(secret_value: str, key: str) -> str:
+    """
+    Extract a key from a JSON secret string, falling back to the raw value.
+
+    A one-byte probe skips the JSON parser (and its exception unwind) for
+    plain-string secrets, which only ever reach the fallback path anyway.
+
+    Args:
+        secret_value: Raw SecretString payload
+        key: Key to extract from the JSON object
+
+    Returns:
+        The extracted value, or the raw string if the payload is not JSON
+    """
+    stripped = secret_value.lstrip()
+    if stripped[:1] not in ("{", "["):
+        return str(secret_value)
+    try:
+        secret_data = _json_loads(stripped)
+    except ValueError:
+        return str(secret_value)
+    return str(secret_data.get(key, ""))
 
 
 class SecretsBackend(Protocol):
@@ -57,21 +223,28 @@ def get_secret_from_aws(
         database_url = get_secret_from_aws("myapp/database-url", key="url")
         api_key = get_secret_from_aws("myapp/api-key")
     """
-    if not HAS_BOTO3:
+    # Check before the boto3 load: empty-name calls stay near-zero-cost
+    if not secret_name:
+        return ""
+
+    if not _load_boto3():
         raise ImportError(
             "AWS Secrets Manager support requires 'boto3'. "
             "Install with: pip install async-aws-lambda[aws]"
         )
 
-    if not secret_name:
-        return ""
+    # Serve from the TTL cache when the entry is still fresh
+    cache_key = (secret_name, key, region_name)
+    now = time.monotonic()
+    with _secret_cache_lock:
+        cached = _secret_cache.get(cache_key)
+        if cached is not None and now - cached[0] < _cache_ttl():
+            return cached[1]
 
     try:
-        # Create a Secrets Manager client
-        session = boto3.session.Session()
-        client = session.client(
-            service_name="secretsmanager",
-            region_name=region_name or os.environ.get("AWS_REGION", "us-east-1"),
+        # Get a cached Secrets Manager client (created once per region)
+        client = _get_client(
+            region_name or os.environ.get("AWS_REGION", "us-east-1")
         )
 
         # Get the secret value
@@ -79,21 +252,29 @@ def get_secret_from_aws(
         secret_value = response.get("SecretString", "")
 
         if key and secret_value:
-            # If key is specified, parse JSON and extract the key
-            try:
-                secret_data = json.loads(secret_value)
-                return str(secret_data.get(key, ""))
-            except json.JSONDecodeError:
-                return str(secret_value)
+            # If key is specified, extract it from the (cached) parsed JSON
+            parsed = _parse_secret_json(
+                secret_name, response.get("VersionId", ""), secret_value
+            )
+            if parsed is _NOT_JSON:
+                value = str(secret_value)
+            else:
+                value = str(parsed.get(key, ""))
         else:
-            return str(secret_value)
+            value = str(secret_value)
+
+        with _secret_cache_lock:
+            _secret_cache[cache_key] = (now, value)
+        return value
 
-    except ClientError as e:
+    except _ClientError as e:
         # Log error but don't raise - return empty string
         import logging
 
         logger = logging.getLogger(__name__)
         logger.error(f"Error fetching secret {secret_name}: {e}")
+        with _secret_cache_lock:
+            _secret_cache.pop(cache_key, None)
         return ""
     except Exception as e:
         import logging
@@ -101,3 +282,189 @@ def get_secret_from_aws(
         logger = logging.getLogger(__name__)
         logger.error(f"Unexpected error fetching secret {secret_name}: {e}")
         return ""
+
+
+# Maximum secret ids per BatchGetSecretValue call (AWS API limit)
+_BATCH_GET_LIMIT = 20
+
+
+def get_secrets_from_aws(
+    secret_names: list[str], region_name: str | None = None
+) -> dict[str, str]:
+    """
+    Get multiple secret values from AWS Secrets Manager in batched calls.
+
+    BatchGetSecretValue returns up to 20 secrets per API round trip, so
+    init-time code that pulls several secrets pays one call instead of one
+    per secret. Fresh entries already in the TTL cache are served from it,
+    and fetched values are cached for subsequent single-secret lookups.
+
+    Args:
+        secret_names: Names of the secrets in AWS Secrets Manager
+        region_name: AWS region (defaults to AWS_REGION env var or us-east-1)
+
+    Returns:
+        Mapping of secret name to value; secrets that could not be fetched
+        are omitted
+
+    Example:
+        secrets = get_secrets_from_aws(["myapp/database-url", "myapp/api-key"])
+    """
+    if not _load_boto3():
+        raise ImportError(
+            "AWS Secrets Manager support requires 'boto3'. "
+            "Install with: pip install async-aws-lambda[aws]"
+        )
+
+    names = [name for name in secret_names if name]
+    if not names:
+        return {}
+
+    # Serve fresh entries from the TTL cache, fetch only the rest
+    results: dict[str, str] = {}
+    now = time.monotonic()
+    ttl = _cache_ttl()
+    with _secret_cache_lock:
+        for name in names:
+            cached = _secret_cache.get((name, None, region_name))
+            if cached is not None and now - cached[0] < ttl:
+                results[name] = cached[1]
+    missing = [name for name in names if name not in results]
+    if not missing:
+        return results
+
+    try:
+        client = _get_client(
+            region_name or os.environ.get("AWS_REGION", "us-east-1")
+        )
+
+        for start in range(0, len(missing), _BATCH_GET_LIMIT):
+            kwargs: dict[str, Any] = {
+                "SecretIdList": missing[start : start + _BATCH_GET_LIMIT]
+            }
+            while True:
+                response = client.batch_get_secret_value(**kwargs)
+                for entry in response.get("SecretValues", []):
+                    results[entry["Name"]] = str(entry.get("SecretString", ""))
+                for error in response.get("Errors", []):
+                    import logging
+
+                    logging.getLogger(__name__).error(
+                        f"Error fetching secret {error.get('SecretId')}: "
+                        f"{error.get('Message')}"
+                    )
+                next_token = response.get("NextToken")
+                if not next_token:
+                    break
+                kwargs["NextToken"] = next_token
+
+        with _secret_cache_lock:
+            for name in missing:
+                if name in results:
+                    _secret_cache[(name, None, region_name)] = (now, results[name])
+        return results
+
+    except _ClientError as e:
+        import logging
+
+        logger = logging.getLogger(__name__)
+        logger.error(f"Error batch-fetching secrets: {e}")
+        return results
+    except Exception as e:
+        import logging
+
+        logger = logging.getLogger(__name__)
+        logger.error(f"Unexpected error batch-fetching secrets: {e}")
+        return results
+
+
+# Endpoint exposed by the AWS Parameters and Secrets Lambda Extension,
+# which caches secrets in-memory inside the Lambda sandbox.
+_EXTENSION_ENDPOINT = "http://localhost:2773/secretsmanager/get"
+
+
+def get_secret_from_extension(secret_name: str, key: str | None = None) -> str:
+    """
+    Get secret value via the AWS Parameters and Secrets Lambda Extension.
+
+    The extension exposes a localhost HTTP endpoint backed by an in-memory
+    cache, avoiding the boto3 import cost on cold start and network round
+    trips on warm invocations. Only the stdlib is used, so this backend
+    works without any extras installed.
+
+    Args:
+        secret_name: Name of the secret in AWS Secrets Manager
+        key: Optional key within the JSON secret (if secret contains JSON)
+
+    Returns:
+        Secret value as string, or empty string if error
+
+    Example:
+        database_url = get_secret_from_extension("myapp/database-url", key="url")
+    """
+    if not secret_name:
+        return ""
+
+    try:
+        url = f"{_EXTENSION_ENDPOINT}?secretId={urllib.parse.quote(secret_name)}"
+        request = urllib.request.Request(
+            url,
+            headers={
+                "X-Aws-Parameters-Secrets-Token": os.environ.get(
+                    "AWS_SESSION_TOKEN", ""
+                )
+            },
+        )
+        with urllib.request.urlopen(request) as response:
+            payload = _json_loads(response.read())
+        secret_value = payload.get("SecretString", "")
+
+        if key and secret_value:
+            # If key is specified, parse JSON and extract the key
+            return _extract_key(secret_value, key)
+        else:
+            return str(secret_value)
+
+    except urllib.error.URLError as e:
+        # Log error but don't raise - return empty string
+        import logging
+
+        logger = logging.getLogger(__name__)
+        logger.error(f"Error fetching secret {secret_name} from extension: {e}")
+        return ""
+    except Exception as e:
+        import logging
+
+        logger = logging.getLogger(__name__)
+        logger.error(
+            f"Unexpected error fetching secret {secret_name} from extension: {e}"
+        )
+        return ""
+
+
+def get_secret(
+    secret_name: str, key: str | None = None, region_name: str | None = None
+) -> str:
+    """
+    Get secret value using the configured backend.
+
+    The backend is selected via the ASYNC_AWS_LAMBDA_SECRETS_BACKEND
+    environment variable ("extension" or "boto3"). When unset, the extension
+    backend is preferred if AWS_SESSION_TOKEN is present (i.e. running inside
+    a Lambda sandbox), falling back to boto3 otherwise.
+
+    Args:
+        secret_name: Name of the secret in AWS Secrets Manager
+        key: Optional key within the JSON secret (if secret contains JSON)
+        region_name: AWS region (boto3 backend only)
+
+    Returns:
+        Secret value as string, or empty string if error
+    """
+    backend = os.environ.get("ASYNC_AWS_LAMBDA_SECRETS_BACKEND", "")
+    if not backend:
+        backend = "extension" if os.environ.get("AWS_SESSION_TOKEN") else "boto3"
+
+    if backend == "extension":
+        return get_secret_from_extension(secret_name, key=key)
+    return get_secret_from_aws(secret_name, key=key, region_name=region_name)
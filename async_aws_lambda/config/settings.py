@@ -5,11 +5,13 @@ This module provides type-safe configuration management with environment variabl
 Requires pydantic and pydantic-settings to be installed.
 """
 
-from functools import lru_cache
+import os
+from pathlib import Path
 from typing import Any
 from typing import TypeVar
 
 try:
+    from dotenv import dotenv_values
     from pydantic_settings import BaseSettings
 except ImportError as e:
     raise ImportError(
@@ -20,6 +22,34 @@ except ImportError as e:
 T = TypeVar("T", bound=BaseSettings)
 
 
+def _preload_env_file(env_file: str | os.PathLike[str] = ".env") -> bool:
+    """
+    Read the .env file once and seed os.environ with its values.
+
+    pydantic-settings re-reads and re-parses the env file for every Settings
+    subclass instantiation. Preloading it into the process environment at
+    import time lets later instantiations skip the disk I/O entirely.
+    Existing environment variables are never overwritten.
+
+    Args:
+        env_file: Path to the env file (default: ".env")
+
+    Returns:
+        True if the file existed and was loaded
+    """
+    path = Path(env_file)
+    if not path.exists():
+        return False
+    environ = os.environ
+    for key, value in dotenv_values(path).items():
+        if value is not None and key not in environ:
+            environ[key] = value
+    return True
+
+
+_ENV_PRELOADED = _preload_env_file()
+
+
 class Settings(BaseSettings):
     """
     Base settings class for Lambda functions.
@@ -37,14 +67,20 @@ class Settings(BaseSettings):
     """
 
     model_config = {
-        "env_file": ".env",
+        # When the .env file was preloaded into os.environ at import time,
+        # skip pydantic-settings' per-instantiation re-read of the file
+        "env_file": None if _ENV_PRELOADED else ".env",
         "env_file_encoding": "utf-8",
         "case_sensitive": True,
         "extra": "ignore",  # Allow extra .env fields
     }
 
 
-@lru_cache
+# Settings instances cached per class; a plain dict lookup is cheaper than
+# the lru_cache wrapper for the handful of classes a Lambda ever registers
+_settings_cache: dict[type[Any], Any] = {}
+
+
 def get_settings(settings_class: type[T] = Settings) -> T:
     """
     Get cached settings instance.
@@ -63,5 +99,8 @@ def get_settings(settings_class: type[T] = Settings) -> T:
 
         settings = get_settings(AppSettings)
     """
-    return settings_class()
+    settings = _settings_cache.get(settings_class)
+    if settings is None:
+        settings = _settings_cache[settings_class] = settings_class()
+    return settings
 
@@ -8,8 +8,10 @@ Requires sqlalchemy[asyncio] to be installed.
 import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 import logging
 import os
+import re
 from typing import Any
 
 try:
@@ -17,6 +19,7 @@ try:
     from sqlalchemy.ext.asyncio import AsyncSession
     from sqlalchemy.ext.asyncio import async_sessionmaker
     from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
     HAS_SQLALCHEMY = True
 except ImportError as e:
     raise ImportError(
@@ -26,10 +29,30 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+# Valid characters for the application_name connection setting
+_APP_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_]+$")
+
+
+def _is_lambda() -> bool:
+    """Check whether the process is running inside a Lambda sandbox."""
+    return "AWS_LAMBDA_FUNCTION_NAME" in os.environ
+
+
+# Pre-parsed health probe; text() does bind-parameter parsing, so build it once
+_HEALTH_PROBE = text("SELECT 1")
+
 # Database engine and session factory
 _engine: Any | None = None
 _async_session_maker: async_sessionmaker[AsyncSession] | None = None
 _initialized = False
+_init_lock = asyncio.Lock()
+
+# Session bound to the current async context. Nested get_db_session calls
+# within one handler share the outer session (and its transaction) instead of
+# opening a new connection and BEGIN/COMMIT cycle per service call.
+_current_session: ContextVar[AsyncSession | None] = ContextVar(
+    "_current_session", default=None
+)
 
 
 async def init_db(
@@ -65,6 +88,37 @@ async def init_db(
         logger.debug("Database already initialized")
         return
 
+    async with _init_lock:
+        # Re-check under the lock: concurrent first invocations may race
+        # here, and only the first should create the engine
+        if _initialized:
+            logger.debug("Database already initialized")
+            return
+
+        await _do_init_db(
+            database_url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            echo=echo,
+            application_name=application_name,
+        )
+
+
+async def _do_init_db(
+    database_url: str | None = None,
+    *,
+    pool_size: int = 2,
+    max_overflow: int = 3,
+    pool_recycle: int = 300,
+    pool_pre_ping: bool = True,
+    echo: bool = False,
+    application_name: str = "async_aws_lambda",
+) -> None:
+    """Create the engine and session factory (caller holds _init_lock)."""
+    global _engine, _async_session_maker, _initialized
+
     try:
         # Get database URL from parameter or environment
         db_url = database_url or os.environ.get("DATABASE_URL", "")
@@ -73,16 +127,16 @@ async def init_db(
                 "DATABASE_URL environment variable or database_url parameter required"
             )
 
+        if not _APP_NAME_PATTERN.match(application_name):
+            raise ValueError(
+                "application_name must contain only letters, digits, and underscores"
+            )
+
         # Create async engine with Lambda-optimized settings
-        _engine = create_async_engine(
-            db_url,
-            echo=echo,
-            pool_pre_ping=pool_pre_ping,
-            pool_recycle=pool_recycle,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
+        engine_kwargs: dict[str, Any] = {
+            "echo": echo,
             # Lambda-specific connection settings
-            connect_args={
+            "connect_args": {
                 "server_settings": {
                     "timezone": "UTC",
                     "application_name": application_name,
@@ -92,9 +146,22 @@ async def init_db(
                 # Add connection cleanup settings
                 "prepared_statement_cache_size": 0,  # Disable prepared statements
             },
-            # Add engine-level cleanup
-            pool_reset_on_return="commit",  # Reset connections on return
-        )
+        }
+        if _is_lambda():
+            # One concurrent request per sandbox: pool bookkeeping and the
+            # pre-ping SELECT before every checkout buy nothing, and pooled
+            # connections can be severed during freezes anyway
+            engine_kwargs["poolclass"] = NullPool
+        else:
+            engine_kwargs.update(
+                pool_pre_ping=pool_pre_ping,
+                pool_recycle=pool_recycle,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                # Add engine-level cleanup
+                pool_reset_on_return="commit",  # Reset connections on return
+            )
+        _engine = create_async_engine(db_url, **engine_kwargs)
 
         # Create session factory with proper cleanup
         _async_session_maker = async_sessionmaker(
@@ -104,12 +171,9 @@ async def init_db(
             autoflush=False,  # Disable autoflush for better control
         )
 
-        # Set timezone to UTC for the connection
-        async with _engine.begin() as conn:
-            await conn.execute(text("SET timezone = 'UTC'"))
-            await conn.execute(
-                text(f"SET application_name = '{application_name}'")
-            )
+        # Timezone and application_name are applied by asyncpg as part of the
+        # startup handshake via connect_args server_settings, so no extra
+        # round-trips are needed here
 
         _initialized = True
         logger.info("Database connections initialized successfully")
@@ -162,24 +226,43 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             # Use session here
             result = await session.execute(select(User))
     """
+    # Nested acquisition within one handler context: share the outer session
+    # so service calls join its transaction; the outer context manager owns
+    # rollback and close
+    existing = _current_session.get()
+    if existing is not None:
+        yield existing
+        return
+
     if not _initialized:
         await init_db()
 
-    if _async_session_maker is None:
+    # Snapshot the session maker so a concurrent close_db() resetting the
+    # global to None cannot race us between check and use
+    session_maker = _async_session_maker
+    if session_maker is None:
         raise RuntimeError("Database session maker not initialized")
 
+    # A single try/finally with a completion flag instead of an except/raise
+    # pair: one less exception-state save/restore per session acquisition
     session = None
+    token = None
+    completed = False
     try:
-        session = _async_session_maker()
-        # Ensure session uses UTC timezone
-        await session.execute(text("SET timezone = 'UTC'"))
+        session = session_maker()
+        token = _current_session.set(session)
+        # Timezone is already UTC via connect_args server_settings, so no
+        # per-session SET round-trip is needed
         yield session
-    except Exception:
-        if session:
-            await session.rollback()
-        raise
+        completed = True
     finally:
-        if session:
+        if token is not None:
+            _current_session.reset(token)
+        if session is not None:
+            # Only pay the rollback round-trip when a transaction actually
+            # began; errors raised before any SQL have nothing to roll back
+            if not completed and session.in_transaction():
+                await session.rollback()
             await session.close()
 
 
@@ -198,12 +281,10 @@ async def check_db_health() -> bool:
         if not _engine:
             return False
 
-        async with _engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
-            # Check timezone setting
-            result = await conn.execute(text("SHOW timezone"))
-            timezone_setting = result.scalar()
-            logger.debug(f"Database timezone setting: {timezone_setting}")
+        # connect() instead of begin(): a read-only probe gains nothing from
+        # the BEGIN/COMMIT round-trips a transaction block would add
+        async with _engine.connect() as conn:
+            await conn.execute(_HEALTH_PROBE)
         return True
 
     except Exception as e:
@@ -238,15 +319,10 @@ try:
                     # Loop is shutting down - skip async cleanup
                     logger.debug("Event loop shutting down - skipping async cleanup")
             except RuntimeError:
-                # No event loop running - safe to create new one
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(close_db())
-                finally:
-                    loop.close()
-                    # Clear the event loop reference
-                    asyncio.set_event_loop(None)
+                # No event loop running - run cleanup on a short-lived one.
+                # asyncio.Runner handles loop creation and teardown for us.
+                with asyncio.Runner() as runner:
+                    runner.run(close_db())
         except Exception as e:
             logger.error(f"Error during database cleanup: {e}")
 
@@ -12,6 +12,7 @@ from .models import (
     ProcessingResult,
 )
 from .handlers import ErrorHandler
+from .recovery import ErrorRecoveryStrategies, PartialProcessingRecovery
 
 __all__ = [
     "ErrorCategory",
@@ -19,6 +20,8 @@ __all__ = [
     "ProcessingError",
     "ProcessingResult",
     "ErrorHandler",
+    "ErrorRecoveryStrategies",
+    "PartialProcessingRecovery",
 ]
 
 # Global error handler instance (optional, for convenience)
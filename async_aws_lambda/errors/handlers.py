@@ -3,8 +3,9 @@ Error handler with classification and retry logic.
 """
 
 import asyncio
+import itertools
 import logging
-import time
+import random
 from collections.abc import Callable
 from typing import Any
 
@@ -12,10 +13,25 @@ from .models import ErrorCategory, ErrorSeverity, ProcessingError
 
 logger = logging.getLogger(__name__)
 
+# Monotonic counter for error IDs; cheaper than a wall-clock syscall per error
+# (the ProcessingError timestamp field already records wall-clock time)
+_err_counter = itertools.count()
+
 
 class ErrorHandler:
     """Centralized error handling for Lambda functions."""
 
+    # Classification table: exception type -> (category, severity, recoverable).
+    # Looked up via the exception's MRO so subclasses resolve to their nearest
+    # classified base, avoiding a per-call isinstance ladder.
+    _CLASSIFY: dict[type[BaseException], tuple[ErrorCategory, ErrorSeverity, bool]] = {
+        ValueError: (ErrorCategory.VALIDATION, ErrorSeverity.MEDIUM, True),
+        ConnectionError: (ErrorCategory.NETWORK, ErrorSeverity.HIGH, True),
+        FileNotFoundError: (ErrorCategory.FILE_PROCESSING, ErrorSeverity.HIGH, False),
+        PermissionError: (ErrorCategory.SYSTEM, ErrorSeverity.CRITICAL, False),
+    }
+    _CLASSIFY_DEFAULT = (ErrorCategory.SYSTEM, ErrorSeverity.HIGH, True)
+
     def __init__(self, max_retries: int = 3, retry_delay: float = 1.0) -> None:
         """
         Initialize error handler.
@@ -28,6 +44,12 @@ class ErrorHandler:
         self.retry_delay = retry_delay
         self.error_counts: dict[ErrorCategory, int] = {}
         self.critical_errors: list[ProcessingError] = []
+        # Running total, kept in sync with error_counts so get_error_summary
+        # does not re-sum the counts on every poll
+        self._total_errors = 0
+        # Precomputed exponential backoff schedule; jitter is applied per
+        # retry to avoid thundering-herd retries against a failing downstream
+        self._retry_schedule = [retry_delay * (2**i) for i in range(max_retries)]
 
     def classify_error(
         self, error: Exception, context: dict[str, Any] | None = None
@@ -42,29 +64,17 @@ class ErrorHandler:
         Returns:
             ProcessingError with classification
         """
-        error_id = f"ERR_{int(time.time())}_{id(error)}"
-
-        # Determine category and severity based on error type
-        if isinstance(error, ValueError):
-            category = ErrorCategory.VALIDATION
-            severity = ErrorSeverity.MEDIUM
-            is_recoverable = True
-        elif isinstance(error, ConnectionError):
-            category = ErrorCategory.NETWORK
-            severity = ErrorSeverity.HIGH
-            is_recoverable = True
-        elif isinstance(error, FileNotFoundError):
-            category = ErrorCategory.FILE_PROCESSING
-            severity = ErrorSeverity.HIGH
-            is_recoverable = False
-        elif isinstance(error, PermissionError):
-            category = ErrorCategory.SYSTEM
-            severity = ErrorSeverity.CRITICAL
-            is_recoverable = False
-        else:
-            category = ErrorCategory.SYSTEM
-            severity = ErrorSeverity.HIGH
-            is_recoverable = True
+        error_id = f"ERR_{next(_err_counter)}"
+
+        # Determine category and severity based on error type: walk the MRO
+        # so subclasses inherit the classification of their nearest base
+        classification = self._CLASSIFY_DEFAULT
+        for error_type in type(error).__mro__:
+            hit = self._CLASSIFY.get(error_type)
+            if hit is not None:
+                classification = hit
+                break
+        category, severity, is_recoverable = classification
 
         return ProcessingError(
             error_id=error_id,
@@ -114,6 +124,7 @@ class ErrorHandler:
         self.error_counts[processing_error.category] = (
             self.error_counts.get(processing_error.category, 0) + 1
         )
+        self._total_errors += 1
 
         # Log error based on severity
         if processing_error.severity == ErrorSeverity.CRITICAL:
@@ -135,7 +146,18 @@ class ErrorHandler:
                 )
 
                 try:
-                    await asyncio.sleep(self.retry_delay * processing_error.retry_count)
+                    if self._retry_schedule:
+                        attempt = min(
+                            processing_error.retry_count - 1,
+                            len(self._retry_schedule) - 1,
+                        )
+                        delay = self._retry_schedule[attempt]
+                    else:
+                        # max_retries=0 leaves the schedule empty while
+                        # should_retry follows the error's own budget; fall
+                        # back to the base delay
+                        delay = self.retry_delay
+                    await asyncio.sleep(delay * (0.5 + random.random() * 0.5))
                     await retry_func()
                     logger.info("Retry successful")
                     return processing_error
@@ -153,10 +175,9 @@ class ErrorHandler:
             Dictionary with error summary
         """
         return {
-            "total_errors": sum(self.error_counts.values()),
-            "error_counts_by_category": {
-                category.value: count for category, count in self.error_counts.items()
-            },
+            "total_errors": self._total_errors,
+            # StrEnum members are strings, so no .value unwrapping is needed
+            "error_counts_by_category": dict(self.error_counts),
             "critical_errors": len(self.critical_errors),
             "critical_error_details": [
                 {
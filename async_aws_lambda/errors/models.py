@@ -2,14 +2,15 @@
 Error models and data classes for error handling.
 """
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 import datetime
 from datetime import timedelta
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
 
-class ErrorSeverity(Enum):
+class ErrorSeverity(StrEnum):
     """Error severity levels."""
 
     LOW = "low"
@@ -18,7 +19,7 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-class ErrorCategory(Enum):
+class ErrorCategory(StrEnum):
     """Error categories for classification."""
 
     VALIDATION = "validation"
@@ -30,7 +31,7 @@ class ErrorCategory(Enum):
     SYSTEM = "system"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingError:
     """Structured error information."""
 
@@ -39,34 +40,30 @@ class ProcessingError:
     severity: ErrorSeverity
     message: str
     details: dict[str, Any] | None = None
-    timestamp: datetime.datetime | None = None
+    timestamp: datetime.datetime = field(
+        default_factory=lambda: datetime.datetime.now(datetime.UTC)
+    )
     retry_count: int = 0
     max_retries: int = 3
     is_recoverable: bool = True
 
-    def __post_init__(self) -> None:
-        """Set default timestamp if not provided."""
-        if self.timestamp is None:
-            self.timestamp = datetime.datetime.now(datetime.UTC)
 
-
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
-    """Result of processing operation."""
+    """
+    Result of processing operation.
+
+    `errors` and `warnings` are read-only sequences. The empty-tuple default
+    means results without errors share one immutable sentinel instead of
+    allocating two fresh lists per row, which matters for million-row runs.
+    """
 
     success: bool
     processed_count: int = 0
     failed_count: int = 0
     skipped_count: int = 0
     pending_research_count: int = 0
-    errors: list[ProcessingError] | None = None
-    warnings: list[str] | None = None
+    errors: Sequence[ProcessingError] = ()
+    warnings: Sequence[str] = ()
     processing_time: timedelta | None = None
 
-    def __post_init__(self) -> None:
-        """Initialize default values for optional fields."""
-        if self.errors is None:
-            self.errors = []
-        if self.warnings is None:
-            self.warnings = []
-
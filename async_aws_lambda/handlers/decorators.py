@@ -7,18 +7,28 @@ This module provides decorators for:
 - @with_config - Optional decorator for configuration injection
 """
 
-import asyncio
 import functools
 import inspect
 from collections.abc import Callable
 from typing import Any, TypeVar
 
-from .lifecycle import lambda_lifecycle
+from .lifecycle import _run_async, lambda_lifecycle
 from .protocols import DatabaseFactory
 
 T = TypeVar("T", bound=Callable[..., Any])
 
 
+async def _run_with_lifecycle(
+    func: Callable[..., Any], event: dict[str, Any], context: Any
+) -> dict[str, Any]:
+    """Execute a handler within the lifecycle context."""
+    async with lambda_lifecycle():
+        # Call the handler - other decorators will inject dependencies
+        # via kwargs, so we just pass event and context as positional args
+        # and let other decorators add their dependencies to kwargs
+        return await func(event, context)
+
+
 def lambda_handler(func: T) -> Callable[[dict[str, Any], Any], dict[str, Any]]:
     """
     Main decorator for async Lambda handlers.
@@ -52,16 +62,9 @@ def lambda_handler(func: T) -> Callable[[dict[str, Any], Any], dict[str, Any]]:
         context: Any,  # AWS Lambda context object
     ) -> dict[str, Any]:
         """Synchronous wrapper for async handler."""
-
-        async def async_wrapper() -> dict[str, Any]:
-            """Execute handler within lifecycle context."""
-            async with lambda_lifecycle():
-                # Call the handler - other decorators will inject dependencies
-                # via kwargs, so we just pass event and context as positional args
-                # and let other decorators add their dependencies to kwargs
-                return await func(event, context)
-
-        return asyncio.run(async_wrapper())
+        # The shared module-level coroutine function avoids rebuilding a
+        # nested function object on every warm invocation
+        return _run_async(_run_with_lifecycle(func, event, context))
 
     return wrapper
 
@@ -120,6 +123,10 @@ def with_database(
                 f"{handler_func.__name__} is not async."
             )
 
+        # Whether the handler wants the session is fixed at decoration time;
+        # inspecting the signature per invocation would be wasted work
+        wants_db_session = "db_session" in inspect.signature(handler_func).parameters
+
         @functools.wraps(handler_func)
         async def wrapper(
             event: dict[str, Any],
@@ -131,9 +138,7 @@ def with_database(
             # Initialize database if needed
             await init_db()
 
-            # Use custom factory or default
-            sig = inspect.signature(handler_func)
-            if "db_session" not in sig.parameters:
+            if not wants_db_session:
                 # Handler doesn't expect db_session, call without it
                 return await handler_func(event, context, *args, **kwargs)
 
@@ -212,6 +217,10 @@ def with_config(
                 f"{handler_func.__name__} is not async."
             )
 
+        # Whether the handler wants settings is fixed at decoration time;
+        # inspecting the signature per invocation would be wasted work
+        wants_settings = "settings" in inspect.signature(handler_func).parameters
+
         @functools.wraps(handler_func)
         async def wrapper(
             event: dict[str, Any],
@@ -227,9 +236,7 @@ def with_config(
                 settings = get_settings(Settings)
 
             # Call handler with settings injected as keyword argument
-            # Use signature inspection to inject in the right place
-            sig = inspect.signature(handler_func)
-            if "settings" in sig.parameters:
+            if wants_settings:
                 # Inject as keyword argument
                 return await handler_func(
                     event, context, *args, settings=settings, **kwargs
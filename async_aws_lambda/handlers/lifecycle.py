@@ -6,21 +6,83 @@ including proper resource cleanup, signal handling, and resource management.
 """
 
 import asyncio
+import atexit
 import logging
+import os
 import signal
 import sys
 import threading
-from collections.abc import AsyncGenerator, Callable
-from contextlib import asynccontextmanager
+from collections.abc import Callable, Coroutine
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Detected once at import: scanning sys.modules and argv on every cold start
+# is avoidable work, and the answer cannot change within a process
+_IS_TEST_MODE = "pytest" in sys.modules or (
+    bool(sys.argv) and "test" in sys.argv[0]
+)
+
 # Add cleanup handling (thread-safe)
 _cleanup_registered = False
-_cleanup_handlers: list[Callable[[], None]] = []
+# Immutable snapshot of registered handlers. register_cleanup_handler swaps
+# in a new tuple under the lock; readers take a single unlocked reference
+# instead of copying a list under the mutex on every invocation.
+_cleanup_handlers: tuple[Callable[[], None], ...] = ()
 _cleanup_lock = threading.Lock()
 
+# Tracks whether lambda_lifecycle already ran the cleanup handlers during the
+# current invocation, so create_lambda_handler's finally block does not run
+# them a second time. Thread-local because the wrapper and the loop it drives
+# share a thread, while concurrent test threads must not see each other's flag.
+_cleanup_state = threading.local()
+
+# Persistent event loop reused across warm invocations. Creating and tearing
+# down a loop per event (as asyncio.run does) repeats selector and executor
+# setup on every invoke; inside Lambda the container outlives the event, so
+# the loop can too.
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_or_create_loop() -> asyncio.AbstractEventLoop:
+    """Get the persistent event loop, creating it on first use (cold start)."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        with _cleanup_lock:
+            if _loop is None or _loop.is_closed():
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+                _loop = loop
+    return _loop
+
+
+def _close_loop() -> None:
+    """Close the persistent event loop at interpreter shutdown."""
+    global _loop
+    loop = _loop
+    if loop is not None and not loop.is_closed():
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+    _loop = None
+
+
+atexit.register(_close_loop)
+
+
+def _run_async(coro: Coroutine[Any, Any, dict[str, Any]]) -> dict[str, Any]:
+    """
+    Run a coroutine to completion.
+
+    Inside Lambda (detected via AWS_LAMBDA_FUNCTION_NAME) the persistent
+    loop is reused so warm invocations skip loop setup and teardown.
+    Elsewhere this falls back to asyncio.run semantics.
+    """
+    if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+        return _get_or_create_loop().run_until_complete(coro)
+    return asyncio.run(coro)
+
 
 def register_cleanup_handler(handler: Callable[[], None]) -> None:
     """
@@ -33,56 +95,55 @@ def register_cleanup_handler(handler: Callable[[], None]) -> None:
     """
     global _cleanup_handlers
     with _cleanup_lock:
-        _cleanup_handlers.append(handler)
+        _cleanup_handlers = (*_cleanup_handlers, handler)
 
 
 def _register_lambda_cleanup() -> None:
-    """Register cleanup handlers for Lambda termination."""
+    """
+    Register cleanup handlers for Lambda termination.
+
+    Callers are expected to check `_cleanup_registered` before calling, so
+    the warm path costs a boolean read instead of a function call.
+    """
     global _cleanup_registered
-    if _cleanup_registered:
-        return
 
     # Skip signal handler registration during testing
-    if "pytest" in sys.modules or "test" in sys.argv[0]:
+    if _IS_TEST_MODE:
         logger.debug("Skipping signal handler registration during testing")
         _cleanup_registered = True
         return
 
     async def cleanup() -> None:
         """Execute all registered cleanup handlers."""
-        # Thread-safe access to cleanup handlers
-        with _cleanup_lock:
-            handlers = list(_cleanup_handlers)
+        # The handlers tuple is replaced atomically, so a plain read suffices
+        handlers = _cleanup_handlers
         for handler in handlers:
             try:
                 handler()
             except Exception as e:
                 logger.error(f"Error during cleanup handler execution: {e}")
 
+    # A classic signal.signal handler, not loop.add_signal_handler: Lambda
+    # delivers SIGTERM between invocations, when the persistent loop is idle
+    # and loop-registered callbacks would never be dispatched. The handler
+    # inspects the loop state and only defers to the loop while an
+    # invocation is actually executing.
     def signal_handler(signum: int, _frame: Any) -> None:
         """Handle termination signals."""
         logger.info(f"Received signal {signum}, initiating cleanup...")
+        loop = _loop
+        if loop is not None and loop.is_running():
+            # Mid-invocation: dispatch through the loop so no user code
+            # runs in signal context; the in-flight invocation finishes
+            # before cleanup executes
+            loop.call_soon_threadsafe(loop.create_task, cleanup())
+            return
+        # Idle persistent loop (the Lambda shutdown case) or no loop at
+        # all: run cleanup to completion right here, then terminate
         try:
-            # Check if event loop is running (Python 3.13 best practice)
-            try:
-                # Check if event loop is running
-                asyncio.get_running_loop()
-                # Event loop is running - schedule cleanup as task
-                # Note: This creates a task but signal handler may exit immediately
-                # For Lambda, we'll use fallback to sync cleanup
-                logger.warning(
-                    "Event loop running during signal handler - " "using sync cleanup"
-                )
-                # Fallback to synchronous cleanup
-                with _cleanup_lock:
-                    handlers = list(_cleanup_handlers)
-                for handler in handlers:
-                    try:
-                        handler()
-                    except Exception as e:
-                        logger.error(f"Error during sync cleanup: {e}")
-            except RuntimeError:
-                # No event loop running - safe to use asyncio.run()
+            if loop is not None and not loop.is_closed():
+                loop.run_until_complete(cleanup())
+            else:
                 asyncio.run(cleanup())
         except Exception as e:
             logger.error(f"Error during signal cleanup: {e}")
@@ -95,8 +156,42 @@ def _register_lambda_cleanup() -> None:
     _cleanup_registered = True
 
 
-@asynccontextmanager
-async def lambda_lifecycle() -> AsyncGenerator[None]:
+class _LambdaLifecycle:
+    """
+    Async context manager for Lambda lifecycle management.
+
+    Hand-written __aenter__/__aexit__ instead of @asynccontextmanager: the
+    generator-backed manager allocates a generator frame and threads every
+    enter/exit through it, which is measurable overhead on every warm
+    invocation. The class holds no per-use state, so one shared instance
+    serves all invocations.
+    """
+
+    __slots__ = ()
+
+    async def __aenter__(self) -> None:
+        # Register cleanup handlers. The boolean is read inline so warm
+        # invocations skip the call frame; registration itself happens once.
+        if not _cleanup_registered:
+            _register_lambda_cleanup()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        # Execute cleanup handlers (atomic tuple read, no lock needed).
+        # With no handlers registered — the common hello-world case — this
+        # exits after a single truthiness check.
+        handlers = _cleanup_handlers
+        for handler in handlers:
+            try:
+                handler()
+            except Exception as e:
+                logger.error(f"Error during final cleanup: {e}")
+        _cleanup_state.lifecycle_ran = True
+
+
+_LIFECYCLE = _LambdaLifecycle()
+
+
+def lambda_lifecycle() -> _LambdaLifecycle:
     """
     Context manager for Lambda lifecycle management.
 
@@ -110,19 +205,7 @@ async def lambda_lifecycle() -> AsyncGenerator[None]:
             # Your handler logic here
             pass
     """
-    try:
-        # Register cleanup handlers
-        _register_lambda_cleanup()
-        yield
-    finally:
-        # Execute cleanup handlers (thread-safe access)
-        with _cleanup_lock:
-            handlers = list(_cleanup_handlers)
-        for handler in handlers:
-            try:
-                handler()
-            except Exception as e:
-                logger.error(f"Error during final cleanup: {e}")
+    return _LIFECYCLE
 
 
 def create_lambda_handler(
@@ -152,22 +235,25 @@ def create_lambda_handler(
         context: Any,  # AWS Lambda context object
     ) -> dict[str, Any]:
         """Synchronous Lambda handler wrapper with proper cleanup."""
+        _cleanup_state.lifecycle_ran = False
         try:
-            return asyncio.run(async_handler_func(event, context))
+            return _run_async(async_handler_func(event, context))
         except Exception as e:
             logger.error(f"Lambda handler failed: {e}")
             raise
         finally:
-            # Final cleanup attempt
+            # Final cleanup attempt. Handlers wrapped in lambda_lifecycle
+            # already ran cleanup in its finally block; running the handlers
+            # again would double cleanup I/O and risk double-close bugs.
             try:
-                # Execute cleanup handlers (thread-safe access)
-                with _cleanup_lock:
-                    handlers = list(_cleanup_handlers)
-                for cleanup_handler in handlers:
-                    try:
-                        cleanup_handler()
-                    except Exception as cleanup_error:
-                        logger.error(f"Cleanup handler failed: {cleanup_error}")
+                if not getattr(_cleanup_state, "lifecycle_ran", False):
+                    # Execute cleanup handlers (atomic tuple read, no lock needed)
+                    handlers = _cleanup_handlers
+                    for cleanup_handler in handlers:
+                        try:
+                            cleanup_handler()
+                        except Exception as cleanup_error:
+                            logger.error(f"Cleanup handler failed: {cleanup_error}")
 
                 # Note: After asyncio.run() completes, the event loop is closed
                 # If any async cleanup is needed, cleanup handlers should handle it
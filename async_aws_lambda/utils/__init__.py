@@ -0,0 +1,9 @@
+"""
+Utility helpers for Lambda functions.
+"""
+
+from .router import handler
+
+__all__ = [
+    "handler",
+]
@@ -0,0 +1,123 @@
+"""
+Generic Lambda entry-point router.
+
+This module provides a single `handler` entry point that dispatches events to
+a per-function handler module selected by the LAMBDA_FUNCTION_ID environment
+variable. It allows one deployment artifact to serve several Lambda functions,
+each configured with a different function id.
+"""
+
+import importlib
+import logging
+import os
+import sys
+from typing import Any
+
+from ..handlers.protocols import LambdaHandler
+
+logger = logging.getLogger(__name__)
+
+# Handler module package searched for function handlers (override via the
+# LAMBDA_HANDLER_PACKAGE environment variable)
+_DEFAULT_HANDLER_PACKAGE = "handlers"
+
+# Resolved handler functions cached per function id. LAMBDA_FUNCTION_ID never
+# changes within a container, so module import, attribute lookup, and protocol
+# validation only need to happen on the first (cold-start) dispatch.
+_HANDLER_CACHE: dict[str, LambdaHandler] = {}
+
+
+def _resolve_handler(function_id: str) -> LambdaHandler:
+    """
+    Resolve the handler function for a function id.
+
+    Imports `<package>.<function_id>` and validates that its `handler`
+    attribute is callable. Called once per function id; the result is cached
+    by `handler`.
+
+    Args:
+        function_id: Value of LAMBDA_FUNCTION_ID
+
+    Returns:
+        The resolved handler callable
+
+    Raises:
+        AttributeError: If the module has no `handler` attribute
+        TypeError: If the `handler` attribute is not a valid handler
+    """
+    package = os.environ.get("LAMBDA_HANDLER_PACKAGE", _DEFAULT_HANDLER_PACKAGE)
+    module_name = f"{package}.{function_id}"
+    # Already-imported modules (typical when handlers live in one package)
+    # resolve with a dict lookup instead of the full import machinery
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+
+    if not hasattr(module, "handler"):
+        raise AttributeError(
+            f"Handler module for function {function_id!r} has no 'handler' attribute"
+        )
+
+    handler_func = module.handler
+    # A callable() check is a single slot read; a runtime_checkable Protocol
+    # isinstance would introspect every protocol member via getattr
+    if not callable(handler_func):
+        raise TypeError(
+            f"Handler for function {function_id!r} is not callable"
+        )
+    return handler_func
+
+
+def _prewarm_from_env() -> None:
+    """
+    Pre-resolve handlers listed in LAMBDA_PREWARM_FUNCTION_IDS.
+
+    The variable holds a comma-separated list of function ids. Resolving
+    them at import time moves handler-module imports into the cold start,
+    so the first dispatch of each function is a plain cache hit. Failures
+    are logged and deferred to dispatch, where they raise normally.
+    """
+    prewarm = os.environ.get("LAMBDA_PREWARM_FUNCTION_IDS", "")
+    for function_id in filter(None, (fid.strip() for fid in prewarm.split(","))):
+        try:
+            _HANDLER_CACHE[function_id] = _resolve_handler(function_id)
+        except Exception as e:
+            logger.warning("Could not pre-warm handler %r: %s", function_id, e)
+
+
+_prewarm_from_env()
+
+
+def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
+    """
+    Dispatch a Lambda event to the handler selected by LAMBDA_FUNCTION_ID.
+
+    The resolved handler is cached per function id, so warm invocations skip
+    module import and protocol validation entirely.
+
+    Args:
+        event: The Lambda event data
+        context: The Lambda context object
+
+    Returns:
+        Response dictionary from the dispatched handler
+
+    Example:
+        # serverless.yml / template.yaml
+        #   handler: async_aws_lambda.utils.router.handler
+        #   environment:
+        #     LAMBDA_FUNCTION_ID: process_orders
+    """
+    function_id = os.environ.get("LAMBDA_FUNCTION_ID", "")
+    if not function_id:
+        raise RuntimeError(
+            "LAMBDA_FUNCTION_ID environment variable is required for routing"
+        )
+
+    cached = _HANDLER_CACHE.get(function_id)
+    if cached is not None:
+        return cached(event, context)
+
+    handler_func = _resolve_handler(function_id)
+    _HANDLER_CACHE[function_id] = handler_func
+    return handler_func(event, context)
@@ -0,0 +1,52 @@
+"""
+Hand-rolled test doubles for SQLAlchemy engine objects.
+
+AsyncMock builds a fresh mock attribute graph on every access, which is
+both slow and noisy to configure for async context managers. These tiny
+classes implement exactly the surface the session module touches, so tests
+can patch create_async_engine with a real object instead of a mock chain.
+"""
+
+
+class FakeConnection:
+    """Minimal async connection usable as ``async with engine.connect()``."""
+
+    __slots__ = ("executed",)
+
+    def __init__(self) -> None:
+        self.executed: list[object] = []
+
+    async def __aenter__(self) -> "FakeConnection":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def execute(self, statement: object) -> None:
+        self.executed.append(statement)
+
+
+class FakeEngine:
+    """Minimal async engine exposing connect(), begin(), and dispose()."""
+
+    __slots__ = ("connection", "connect_error", "create_calls", "dispose_count")
+
+    def __init__(self, connect_error: Exception | None = None) -> None:
+        self.connection = FakeConnection()
+        self.connect_error = connect_error
+        # kwargs of each create_async_engine call, recorded by the db_engine
+        # fixture in conftest.py
+        self.create_calls: list[dict[str, object]] = []
+        self.dispose_count = 0
+
+    def connect(self) -> FakeConnection:
+        if self.connect_error is not None:
+            raise self.connect_error
+        return self.connection
+
+    # begin() shares the connection double; the context manager protocol is
+    # identical for the purposes of these tests
+    begin = connect
+
+    async def dispose(self) -> None:
+        self.dispose_count += 1
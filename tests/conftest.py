@@ -3,34 +3,86 @@ Pytest configuration and shared fixtures.
 """
 
 import asyncio
+import copy
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from tests._fakes import FakeEngine
+
 # Configure pytest-asyncio
 pytest_plugins = ("pytest_asyncio",)
 
 
 @pytest.fixture
-def mock_lambda_context() -> Any:
-    """Create a mock Lambda context object."""
-    context = MagicMock()
-    context.function_name = "test-function"
-    context.function_version = "$LATEST"
-    context.invoked_function_arn = (
-        "arn:aws:lambda:us-east-1:123456789012:function:test-function"
+def db_engine(monkeypatch: pytest.MonkeyPatch) -> FakeEngine:
+    """Patch create_async_engine to return a shared FakeEngine.
+
+    monkeypatch.setattr is cheaper than a unittest.mock patch context
+    manager, and the fake records the kwargs of each create call so tests
+    can assert on engine configuration without a MagicMock chain.
+    """
+    fake = FakeEngine()
+
+    def _create_engine(url: str, **kwargs: Any) -> FakeEngine:
+        fake.create_calls.append(kwargs)
+        return fake
+
+    monkeypatch.setattr(
+        "async_aws_lambda.database.session.create_async_engine", _create_engine
+    )
+    return fake
+
+
+@pytest.fixture(scope="session")
+def _lambda_context_base() -> Any:
+    """Session-scoped Lambda context template, built once per run."""
+    # A passive attribute bag: SimpleNamespace is far cheaper to build
+    # than a MagicMock
+    return SimpleNamespace(
+        function_name="test-function",
+        function_version="$LATEST",
+        invoked_function_arn=(
+            "arn:aws:lambda:us-east-1:123456789012:function:test-function"
+        ),
+        memory_limit_in_mb=128,
+        aws_request_id="test-request-id",
+        log_group_name="/aws/lambda/test-function",
+        log_stream_name="2024/01/01/[$LATEST]test-stream",
     )
-    context.memory_limit_in_mb = 128
-    context.aws_request_id = "test-request-id"
-    context.log_group_name = "/aws/lambda/test-function"
-    context.log_stream_name = "2024/01/01/[$LATEST]test-stream"
-    return context
 
 
 @pytest.fixture
-def sample_event() -> dict[str, Any]:
-    """Create a sample Lambda event."""
+def mock_lambda_context(_lambda_context_base: Any) -> Any:
+    """Create a mock Lambda context object.
+
+    A shallow copy of the session template: tests may mutate attributes
+    without leaking into each other, and the copy is cheaper than
+    rebuilding the namespace per test.
+    """
+    return copy.copy(_lambda_context_base)
+
+
+@pytest.fixture(scope="session")
+def mock_db_session_cm() -> MagicMock:
+    """Async-context-manager mock that yields a mock database session.
+
+    Session-scoped: the consuming tests never assert against its call
+    tracking, so one mock graph serves the whole run. MagicMock already
+    configures __aenter__/__aexit__ as AsyncMocks, so only the entry
+    value needs setting.
+    """
+    cm = MagicMock()
+    cm.__aenter__.return_value = AsyncMock()
+    cm.__aexit__.return_value = None
+    return cm
+
+
+@pytest.fixture(scope="session")
+def _sample_event_base() -> dict[str, Any]:
+    """Session-scoped sample event template, built once per run."""
     return {
         "httpMethod": "GET",
         "path": "/test",
@@ -40,11 +92,9 @@ def sample_event() -> dict[str, Any]:
 
 
 @pytest.fixture
-def event_loop():
-    """Create an event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def sample_event(_sample_event_base: dict[str, Any]) -> dict[str, Any]:
+    """Create a sample Lambda event as a per-test shallow copy."""
+    return copy.copy(_sample_event_base)
 
 
 @pytest.fixture
@@ -54,27 +104,52 @@ def reset_cleanup_handlers():
 
     # Reset before test
     with lifecycle_module._cleanup_lock:
-        lifecycle_module._cleanup_handlers.clear()
+        lifecycle_module._cleanup_handlers = ()
         lifecycle_module._cleanup_registered = False
 
     yield
 
     # Reset after test
     with lifecycle_module._cleanup_lock:
-        lifecycle_module._cleanup_handlers.clear()
+        lifecycle_module._cleanup_handlers = ()
         lifecycle_module._cleanup_registered = False
 
 
+@pytest.fixture(autouse=True)
+def reset_secrets_client_cache():
+    """Reset the cached Secrets Manager clients before and after each test."""
+    try:
+        from async_aws_lambda.config import secrets as secrets_module
+
+        # Reset before test
+        secrets_module._session = None
+        secrets_module._clients.clear()
+        secrets_module._secret_cache.clear()
+        secrets_module._parsed_cache.clear()
+
+        yield
+
+        # Clean up after test
+        secrets_module._session = None
+        secrets_module._clients.clear()
+        secrets_module._secret_cache.clear()
+        secrets_module._parsed_cache.clear()
+    except ImportError:
+        # Config module not available, skip
+        yield
+
+
 @pytest.fixture(autouse=True)
 def reset_database_state():
     """Reset database state before and after each test."""
     try:
         from async_aws_lambda.database import session as db_session_module
 
-        # Reset before test
+        # Reset before test (fresh lock: each test runs its own event loop)
         db_session_module._initialized = False
         db_session_module._engine = None
         db_session_module._async_session_maker = None
+        db_session_module._init_lock = asyncio.Lock()
 
         yield
 
@@ -82,6 +157,7 @@ def reset_database_state():
         db_session_module._initialized = False
         db_session_module._engine = None
         db_session_module._async_session_maker = None
+        db_session_module._init_lock = asyncio.Lock()
     except ImportError:
         # Database module not available, skip
         yield
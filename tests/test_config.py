@@ -3,7 +3,7 @@ Tests for configuration module.
 """
 
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -48,13 +48,40 @@ class TestSettings:
         assert isinstance(settings, Settings)
         assert isinstance(settings, CustomSettings)
 
+    @pytest.mark.unit
+    def test_preload_env_file(self, tmp_path):
+        """Test that _preload_env_file seeds os.environ without overwriting."""
+        from async_aws_lambda.config.settings import _preload_env_file
+
+        env_file = tmp_path / ".env"
+        env_file.write_text("PRELOADED_KEY=from-file\nEXISTING_KEY=from-file\n")
+
+        with patch.dict(os.environ, {"EXISTING_KEY": "from-env"}):
+            os.environ.pop("PRELOADED_KEY", None)
+
+            assert _preload_env_file(env_file) is True
+            assert os.environ["PRELOADED_KEY"] == "from-file"
+            # Existing environment variables win over the file
+            assert os.environ["EXISTING_KEY"] == "from-env"
+
+    @pytest.mark.unit
+    def test_preload_env_file_missing(self, tmp_path):
+        """Test that _preload_env_file is a no-op for a missing file."""
+        from async_aws_lambda.config.settings import _preload_env_file
+
+        assert _preload_env_file(tmp_path / "missing.env") is False
+
     @pytest.mark.unit
     def test_get_settings_cached(self):
         """Test that get_settings returns cached instance."""
-        from async_aws_lambda.config.settings import Settings, get_settings
+        from async_aws_lambda.config.settings import (
+            Settings,
+            _settings_cache,
+            get_settings,
+        )
 
         # Clear cache
-        get_settings.cache_clear()
+        _settings_cache.clear()
 
         settings1 = get_settings(Settings)
         settings2 = get_settings(Settings)
@@ -65,7 +92,11 @@ class TestSettings:
     @pytest.mark.unit
     def test_get_settings_different_classes(self):
         """Test that get_settings returns different instances for different classes."""
-        from async_aws_lambda.config.settings import Settings, get_settings
+        from async_aws_lambda.config.settings import (
+            Settings,
+            _settings_cache,
+            get_settings,
+        )
 
         class Settings1(Settings):
             pass
@@ -74,7 +105,7 @@ class TestSettings:
             pass
 
         # Clear cache
-        get_settings.cache_clear()
+        _settings_cache.clear()
 
         settings1 = get_settings(Settings1)
         settings2 = get_settings(Settings2)
@@ -147,7 +178,7 @@ class TestSecrets:
         get_secret_from_aws("my-secret", region_name="us-west-2")
 
         mock_session.client.assert_called_once_with(
-            service_name="secretsmanager", region_name="us-west-2"
+            service_name="secretsmanager", region_name="us-west-2", config=ANY
         )
 
     @pytest.mark.unit
@@ -166,9 +197,28 @@ class TestSecrets:
             get_secret_from_aws("my-secret")
 
             mock_session.client.assert_called_once_with(
-                service_name="secretsmanager", region_name="eu-west-1"
+                service_name="secretsmanager", region_name="eu-west-1", config=ANY
             )
 
+    @pytest.mark.unit
+    @patch("boto3.session.Session")
+    def test_get_secret_from_aws_reuses_cached_client(self, mock_session_class):
+        """Test that get_secret_from_aws reuses the cached client per region."""
+        from async_aws_lambda.config.secrets import get_secret_from_aws
+
+        mock_client = MagicMock()
+        mock_client.get_secret_value.return_value = {"SecretString": "secret"}
+        mock_session = MagicMock()
+        mock_session.client.return_value = mock_client
+        mock_session_class.return_value = mock_session
+
+        get_secret_from_aws("my-secret")
+        get_secret_from_aws("other-secret")
+
+        # Client should only be created once for the region
+        mock_session.client.assert_called_once()
+        assert mock_client.get_secret_value.call_count == 2
+
     @pytest.mark.unit
     @patch("boto3.session.Session")
     def test_get_secret_from_aws_handles_client_error(self, mock_session_class):
@@ -206,6 +256,49 @@ class TestSecrets:
         secret = get_secret_from_aws("my-secret", key="url")
         assert secret == "not-json"
 
+    @pytest.mark.unit
+    @patch("boto3.session.Session")
+    def test_get_secret_from_aws_caches_secret_value(self, mock_session_class):
+        """Test that get_secret_from_aws memoizes values within the TTL."""
+        from async_aws_lambda.config.secrets import get_secret_from_aws
+
+        mock_client = MagicMock()
+        mock_client.get_secret_value.return_value = {"SecretString": "secret"}
+        mock_session = MagicMock()
+        mock_session.client.return_value = mock_client
+        mock_session_class.return_value = mock_session
+
+        first = get_secret_from_aws("my-secret")
+        second = get_secret_from_aws("my-secret")
+
+        assert first == second == "secret"
+        # Second call should be served from the cache
+        mock_client.get_secret_value.assert_called_once()
+
+    @pytest.mark.unit
+    @patch("boto3.session.Session")
+    def test_get_secret_from_aws_cache_expires(self, mock_session_class):
+        """Test that cached secrets are re-fetched after the TTL expires."""
+        from async_aws_lambda.config import secrets as secrets_module
+        from async_aws_lambda.config.secrets import get_secret_from_aws
+
+        mock_client = MagicMock()
+        mock_client.get_secret_value.return_value = {"SecretString": "secret"}
+        mock_session = MagicMock()
+        mock_session.client.return_value = mock_client
+        mock_session_class.return_value = mock_session
+
+        get_secret_from_aws("my-secret")
+
+        # Age the cached entry past the TTL
+        cache_key = ("my-secret", None, None)
+        timestamp, value = secrets_module._secret_cache[cache_key]
+        secrets_module._secret_cache[cache_key] = (timestamp - 301.0, value)
+
+        get_secret_from_aws("my-secret")
+
+        assert mock_client.get_secret_value.call_count == 2
+
     @pytest.mark.unit
     def test_get_secret_from_aws_empty_secret_name(self):
         """Test that get_secret_from_aws returns empty string for empty secret name."""
@@ -215,6 +308,241 @@ class TestSecrets:
         assert secret == ""
 
 
+class TestSecretsParsedCache:
+    """Tests for the parsed-JSON secret cache."""
+
+    @pytest.mark.unit
+    @patch("boto3.session.Session")
+    def test_json_secret_parsed_once_across_keys(self, mock_session_class):
+        """Test that reading several keys parses the SecretString once."""
+        import json
+
+        from async_aws_lambda.config.secrets import get_secret_from_aws
+
+        secret_data = {"url": "postgresql://localhost/db", "password": "secret"}
+        mock_client = MagicMock()
+        mock_client.get_secret_value.return_value = {
+            "SecretString": json.dumps(secret_data),
+            "VersionId": "v1",
+        }
+        mock_session = MagicMock()
+        mock_session.client.return_value = mock_client
+        mock_session_class.return_value = mock_session
+
+        with patch(
+            "async_aws_lambda.config.secrets._json_loads", wraps=json.loads
+        ) as mock_loads:
+            url = get_secret_from_aws("my-secret", key="url")
+            password = get_secret_from_aws("my-secret", key="password")
+
+        assert url == "postgresql://localhost/db"
+        assert password == "secret"
+        mock_loads.assert_called_once()
+
+
+class TestSecretsBatch:
+    """Tests for batched secret fetching via BatchGetSecretValue."""
+
+    @pytest.mark.unit
+    @patch("boto3.session.Session")
+    def test_get_secrets_from_aws_single_batch_call(self, mock_session_class):
+        """Test that multiple secrets are fetched in one API call."""
+        from async_aws_lambda.config.secrets import get_secrets_from_aws
+
+        mock_client = MagicMock()
+        mock_client.batch_get_secret_value.return_value = {
+            "SecretValues": [
+                {"Name": "secret-a", "SecretString": "value-a"},
+                {"Name": "secret-b", "SecretString": "value-b"},
+            ]
+        }
+        mock_session = MagicMock()
+        mock_session.client.return_value = mock_client
+        mock_session_class.return_value = mock_session
+
+        secrets = get_secrets_from_aws(["secret-a", "secret-b"])
+
+        assert secrets == {"secret-a": "value-a", "secret-b": "value-b"}
+        mock_client.batch_get_secret_value.assert_called_once_with(
+            SecretIdList=["secret-a", "secret-b"]
+        )
+
+    @pytest.mark.unit
+    @patch("boto3.session.Session")
+    def test_get_secrets_from_aws_follows_next_token(self, mock_session_class):
+        """Test that pagination continues until NextToken is exhausted."""
+        from async_aws_lambda.config.secrets import get_secrets_from_aws
+
+        mock_client = MagicMock()
+        mock_client.batch_get_secret_value.side_effect = [
+            {
+                "SecretValues": [{"Name": "secret-a", "SecretString": "value-a"}],
+                "NextToken": "token",
+            },
+            {"SecretValues": [{"Name": "secret-b", "SecretString": "value-b"}]},
+        ]
+        mock_session = MagicMock()
+        mock_session.client.return_value = mock_client
+        mock_session_class.return_value = mock_session
+
+        secrets = get_secrets_from_aws(["secret-a", "secret-b"])
+
+        assert secrets == {"secret-a": "value-a", "secret-b": "value-b"}
+        assert mock_client.batch_get_secret_value.call_count == 2
+
+    @pytest.mark.unit
+    @patch("boto3.session.Session")
+    def test_get_secrets_from_aws_seeds_single_secret_cache(
+        self, mock_session_class
+    ):
+        """Test that batch results are served to later single-secret fetches."""
+        from async_aws_lambda.config.secrets import (
+            get_secret_from_aws,
+            get_secrets_from_aws,
+        )
+
+        mock_client = MagicMock()
+        mock_client.batch_get_secret_value.return_value = {
+            "SecretValues": [{"Name": "secret-a", "SecretString": "value-a"}]
+        }
+        mock_session = MagicMock()
+        mock_session.client.return_value = mock_client
+        mock_session_class.return_value = mock_session
+
+        get_secrets_from_aws(["secret-a"])
+        secret = get_secret_from_aws("secret-a")
+
+        assert secret == "value-a"
+        mock_client.get_secret_value.assert_not_called()
+
+    @pytest.mark.unit
+    def test_get_secrets_from_aws_empty_list(self):
+        """Test that an empty name list short-circuits without API calls."""
+        from async_aws_lambda.config.secrets import get_secrets_from_aws
+
+        assert get_secrets_from_aws([]) == {}
+
+
+class TestSecretsExtension:
+    """Tests for the Parameters and Secrets Lambda Extension backend."""
+
+    def _mock_response(self, payload: str):
+        """Build a context-manager mock mimicking urllib's response."""
+        mock_response = MagicMock()
+        mock_response.read.return_value = payload.encode()
+        mock_response.__enter__ = MagicMock(return_value=mock_response)
+        mock_response.__exit__ = MagicMock(return_value=None)
+        return mock_response
+
+    @pytest.mark.unit
+    @patch("urllib.request.urlopen")
+    def test_get_secret_from_extension_simple_secret(self, mock_urlopen):
+        """Test that get_secret_from_extension retrieves simple secrets."""
+        import json
+
+        from async_aws_lambda.config.secrets import get_secret_from_extension
+
+        mock_urlopen.return_value = self._mock_response(
+            json.dumps({"SecretString": "my-secret-value"})
+        )
+
+        secret = get_secret_from_extension("my-secret")
+
+        assert secret == "my-secret-value"
+
+    @pytest.mark.unit
+    @patch("urllib.request.urlopen")
+    def test_get_secret_from_extension_json_secret(self, mock_urlopen):
+        """Test that get_secret_from_extension extracts keys from JSON secrets."""
+        import json
+
+        from async_aws_lambda.config.secrets import get_secret_from_extension
+
+        secret_data = {"url": "postgresql://localhost/db", "password": "secret"}
+        mock_urlopen.return_value = self._mock_response(
+            json.dumps({"SecretString": json.dumps(secret_data)})
+        )
+
+        secret = get_secret_from_extension("my-secret", key="url")
+
+        assert secret == "postgresql://localhost/db"
+
+    @pytest.mark.unit
+    @patch("urllib.request.urlopen")
+    def test_get_secret_from_extension_sends_session_token(self, mock_urlopen):
+        """Test that get_secret_from_extension sends the session token header."""
+        import json
+
+        from async_aws_lambda.config.secrets import get_secret_from_extension
+
+        mock_urlopen.return_value = self._mock_response(
+            json.dumps({"SecretString": "secret"})
+        )
+
+        with patch.dict(os.environ, {"AWS_SESSION_TOKEN": "test-token"}):
+            get_secret_from_extension("my-secret")
+
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("X-aws-parameters-secrets-token") == "test-token"
+
+    @pytest.mark.unit
+    @patch("urllib.request.urlopen")
+    def test_get_secret_from_extension_handles_url_error(self, mock_urlopen):
+        """Test that get_secret_from_extension handles connection errors."""
+        import urllib.error
+
+        from async_aws_lambda.config.secrets import get_secret_from_extension
+
+        mock_urlopen.side_effect = urllib.error.URLError("extension not running")
+
+        secret = get_secret_from_extension("my-secret")
+
+        # Should return empty string on error
+        assert secret == ""
+
+    @pytest.mark.unit
+    def test_get_secret_from_extension_empty_secret_name(self):
+        """Test that get_secret_from_extension returns empty string for empty name."""
+        from async_aws_lambda.config.secrets import get_secret_from_extension
+
+        secret = get_secret_from_extension("")
+        assert secret == ""
+
+    @pytest.mark.unit
+    @patch("async_aws_lambda.config.secrets.get_secret_from_extension")
+    def test_get_secret_prefers_extension_with_session_token(self, mock_extension):
+        """Test that get_secret defaults to the extension inside a Lambda sandbox."""
+        from async_aws_lambda.config.secrets import get_secret
+
+        mock_extension.return_value = "secret"
+
+        with patch.dict(os.environ, {"AWS_SESSION_TOKEN": "test-token"}):
+            secret = get_secret("my-secret")
+
+        assert secret == "secret"
+        mock_extension.assert_called_once_with("my-secret", key=None)
+
+    @pytest.mark.unit
+    @patch("async_aws_lambda.config.secrets.get_secret_from_aws")
+    def test_get_secret_backend_override(self, mock_boto3_backend):
+        """Test that ASYNC_AWS_LAMBDA_SECRETS_BACKEND selects the backend."""
+        from async_aws_lambda.config.secrets import get_secret
+
+        mock_boto3_backend.return_value = "secret"
+
+        env = {
+            "AWS_SESSION_TOKEN": "test-token",
+            "ASYNC_AWS_LAMBDA_SECRETS_BACKEND": "boto3",
+        }
+        with patch.dict(os.environ, env):
+            secret = get_secret("my-secret")
+
+        assert secret == "secret"
+        mock_boto3_backend.assert_called_once_with(
+            "my-secret", key=None, region_name=None
+        )
+
+
 @pytest.mark.requires_config
 class TestConfigModule:
     """Tests for config module exports."""
@@ -2,8 +2,8 @@
 Tests for error handling module.
 """
 
-import datetime
-from unittest.mock import AsyncMock
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -14,6 +14,60 @@ from async_aws_lambda.errors.models import (
     ProcessingError,
     ProcessingResult,
 )
+from async_aws_lambda.errors.recovery import (
+    ErrorRecoveryStrategies,
+    PartialProcessingRecovery,
+    checkpoint_timestamp_iso,
+    deserialize_checkpoint,
+    serialize_checkpoint,
+)
+
+
+@pytest.fixture
+def handler() -> ErrorHandler:
+    """Fresh ErrorHandler per test so error tracking state never leaks."""
+    return ErrorHandler()
+
+
+@pytest.fixture(scope="module")
+def preloaded_handler() -> ErrorHandler:
+    """ErrorHandler preloaded with a known error history.
+
+    Module-scoped: get_error_summary is read-only, so one shared instance
+    serves every summary assertion without rebuilding the state dicts.
+    """
+    h = ErrorHandler()
+    h.error_counts = {
+        ErrorCategory.VALIDATION: 5,
+        ErrorCategory.NETWORK: 2,
+    }
+    h._total_errors = 7
+    h.critical_errors = [
+        ProcessingError(
+            error_id="ERR_123",
+            category=ErrorCategory.SYSTEM,
+            severity=ErrorSeverity.CRITICAL,
+            message="Critical error",
+        )
+    ]
+    return h
+
+
+@pytest.fixture(scope="session")
+def make_processing_error():
+    """Factory for ProcessingError instances with shared defaults."""
+
+    def _make(**overrides: object) -> ProcessingError:
+        defaults: dict[str, object] = {
+            "error_id": "ERR_123",
+            "category": ErrorCategory.VALIDATION,
+            "severity": ErrorSeverity.MEDIUM,
+            "message": "Test error",
+        }
+        defaults.update(overrides)
+        return ProcessingError(**defaults)
+
+    return _make
 
 
 class TestErrorModels:
@@ -22,18 +76,21 @@ class TestErrorModels:
     @pytest.mark.unit
     def test_error_severity_enum(self):
         """Test ErrorSeverity enum values."""
-        assert ErrorSeverity.LOW.value == "low"
-        assert ErrorSeverity.MEDIUM.value == "medium"
-        assert ErrorSeverity.HIGH.value == "high"
-        assert ErrorSeverity.CRITICAL.value == "critical"
+        assert {e.value for e in ErrorSeverity} == {
+            "low",
+            "medium",
+            "high",
+            "critical",
+        }
 
     @pytest.mark.unit
     def test_error_category_enum(self):
         """Test ErrorCategory enum values."""
-        assert ErrorCategory.VALIDATION.value == "validation"
-        assert ErrorCategory.DATABASE.value == "database"
-        assert ErrorCategory.NETWORK.value == "network"
-        assert ErrorCategory.SYSTEM.value == "system"
+        # Subset check: the enum also carries categories such as
+        # FILE_PROCESSING that other tests cover
+        assert {"validation", "database", "network", "system"} <= {
+            e.value for e in ErrorCategory
+        }
 
     @pytest.mark.unit
     def test_processing_error_creation(self):
@@ -64,7 +121,7 @@ class TestErrorModels:
         )
 
         assert error.timestamp is not None
-        assert isinstance(error.timestamp, datetime.datetime)
+        assert isinstance(error.timestamp, datetime)
 
     @pytest.mark.unit
     def test_processing_result_creation(self):
@@ -75,8 +132,8 @@ class TestErrorModels:
         assert result.processed_count == 10
         assert result.failed_count == 2
         assert result.skipped_count == 0
-        assert result.errors == []
-        assert result.warnings == []
+        assert result.errors == ()
+        assert result.warnings == ()
 
     @pytest.mark.unit
     def test_processing_result_with_errors(self):
@@ -109,182 +166,374 @@ class TestErrorHandler:
         assert handler.critical_errors == []
 
     @pytest.mark.unit
-    def test_classify_error_value_error(self):
-        """Test error classification for ValueError."""
-        handler = ErrorHandler()
+    @pytest.mark.parametrize(
+        ("error", "category", "severity", "is_recoverable"),
+        [
+            (
+                ValueError("Invalid value"),
+                ErrorCategory.VALIDATION,
+                ErrorSeverity.MEDIUM,
+                True,
+            ),
+            (
+                ConnectionError("Connection failed"),
+                ErrorCategory.NETWORK,
+                ErrorSeverity.HIGH,
+                True,
+            ),
+            (
+                FileNotFoundError("File not found"),
+                ErrorCategory.FILE_PROCESSING,
+                ErrorSeverity.HIGH,
+                False,
+            ),
+            (
+                PermissionError("Permission denied"),
+                ErrorCategory.SYSTEM,
+                ErrorSeverity.CRITICAL,
+                False,
+            ),
+        ],
+    )
+    def test_classify_error(self, handler, error, category, severity, is_recoverable):
+        """Test error classification by exception type."""
+        processing_error = handler.classify_error(error)
+
+        assert processing_error.category == category
+        assert processing_error.severity == severity
+        assert processing_error.is_recoverable is is_recoverable
+
+    @pytest.mark.unit
+    def test_classify_error_with_context(self, handler):
+        """Test error classification with context."""
         error = ValueError("Invalid value")
+        context = {"user_id": "123", "action": "create"}
 
-        processing_error = handler.classify_error(error)
+        processing_error = handler.classify_error(error, context)
 
-        assert processing_error.category == ErrorCategory.VALIDATION
-        assert processing_error.severity == ErrorSeverity.MEDIUM
-        assert processing_error.is_recoverable is True
+        assert processing_error.details == context
 
     @pytest.mark.unit
-    def test_classify_error_connection_error(self):
-        """Test error classification for ConnectionError."""
-        handler = ErrorHandler()
-        error = ConnectionError("Connection failed")
+    @pytest.mark.parametrize(
+        ("overrides", "expected"),
+        [
+            pytest.param(
+                {"is_recoverable": True, "retry_count": 0},
+                True,
+                id="recoverable",
+            ),
+            pytest.param(
+                {
+                    "category": ErrorCategory.SYSTEM,
+                    "severity": ErrorSeverity.CRITICAL,
+                    "is_recoverable": False,
+                },
+                False,
+                id="non-recoverable",
+            ),
+            pytest.param(
+                {"is_recoverable": True, "retry_count": 3, "max_retries": 3},
+                False,
+                id="max-retries-reached",
+            ),
+            pytest.param(
+                {
+                    "category": ErrorCategory.SYSTEM,
+                    "severity": ErrorSeverity.CRITICAL,
+                    "is_recoverable": True,
+                },
+                False,
+                id="critical-severity",
+            ),
+        ],
+    )
+    def test_should_retry(self, handler, make_processing_error, overrides, expected):
+        """Test should_retry across recoverability, retry budget, and severity."""
+        error = make_processing_error(**overrides)
+
+        assert handler.should_retry(error) is expected
 
-        processing_error = handler.classify_error(error)
+    @pytest.mark.unit
+    async def test_handle_error_with_retry(self):
+        """Test handle_error retries on an exponential jittered schedule."""
+        handler = ErrorHandler(max_retries=3, retry_delay=0.1)
+        error = ValueError("Test error")
 
-        assert processing_error.category == ErrorCategory.NETWORK
-        assert processing_error.severity == ErrorSeverity.HIGH
-        assert processing_error.is_recoverable is True
+        # Plain async stub instead of an AsyncMock: no spec-tree construction,
+        # and a call counter is all the tracking this test needs. Fail twice,
+        # then succeed, so all three backoff steps are exercised
+        calls: list[None] = []
+
+        async def retry_func() -> None:
+            calls.append(None)
+            if len(calls) < 3:
+                raise ConnectionError("still down")
+
+        # Patch out the sleep so the test runs instantly, and pin the jitter
+        # to its lower bound (0.5x) so the delay sequence is deterministic
+        with (
+            patch(
+                "async_aws_lambda.errors.handlers.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as mock_sleep,
+            patch("async_aws_lambda.errors.handlers.random.random", return_value=0.0),
+        ):
+            processing_error = await handler.handle_error(error, retry_func=retry_func)
+
+        assert processing_error.retry_count == 3
+        assert len(calls) == 3
+        delays = [c.args[0] for c in mock_sleep.await_args_list]
+        assert delays == [pytest.approx(0.1 * (2**i) * 0.5) for i in range(3)]
 
     @pytest.mark.unit
-    def test_classify_error_file_not_found(self):
-        """Test error classification for FileNotFoundError."""
-        handler = ErrorHandler()
-        error = FileNotFoundError("File not found")
+    async def test_handle_error_tracks_error_counts(self, handler):
+        """Test that handle_error tracks error counts."""
+        error = ValueError("Test error")
 
-        processing_error = handler.classify_error(error)
+        await handler.handle_error(error)
 
-        assert processing_error.category == ErrorCategory.FILE_PROCESSING
-        assert processing_error.severity == ErrorSeverity.HIGH
-        assert processing_error.is_recoverable is False
+        assert ErrorCategory.VALIDATION in handler.error_counts
+        assert handler.error_counts[ErrorCategory.VALIDATION] == 1
 
     @pytest.mark.unit
-    def test_classify_error_permission_error(self):
-        """Test error classification for PermissionError."""
-        handler = ErrorHandler()
+    async def test_handle_error_tracks_critical_errors(self, handler):
+        """Test that handle_error tracks critical errors."""
         error = PermissionError("Permission denied")
 
-        processing_error = handler.classify_error(error)
+        await handler.handle_error(error)
 
-        assert processing_error.category == ErrorCategory.SYSTEM
-        assert processing_error.severity == ErrorSeverity.CRITICAL
-        assert processing_error.is_recoverable is False
+        assert len(handler.critical_errors) == 1
+        assert handler.critical_errors[0].severity == ErrorSeverity.CRITICAL
 
     @pytest.mark.unit
-    def test_classify_error_with_context(self):
-        """Test error classification with context."""
-        handler = ErrorHandler()
-        error = ValueError("Invalid value")
-        context = {"user_id": "123", "action": "create"}
+    def test_get_error_summary(self, preloaded_handler):
+        """Test get_error_summary."""
+        summary = preloaded_handler.get_error_summary()
 
-        processing_error = handler.classify_error(error, context)
+        assert summary["total_errors"] == 7
+        assert summary["error_counts_by_category"]["validation"] == 5
+        assert summary["error_counts_by_category"]["network"] == 2
+        assert summary["critical_errors"] == 1
 
-        assert processing_error.details == context
+
+class TestErrorRecoveryStrategies:
+    """Tests for ErrorRecoveryStrategies."""
 
     @pytest.mark.unit
-    def test_should_retry_recoverable_error(self):
-        """Test should_retry for recoverable error."""
-        handler = ErrorHandler()
-        error = ProcessingError(
-            error_id="ERR_123",
-            category=ErrorCategory.VALIDATION,
-            severity=ErrorSeverity.MEDIUM,
-            message="Test error",
-            is_recoverable=True,
-            retry_count=0,
+    def test_skip_row_recovery(self):
+        """Test that skip_row_recovery skips the row and continues."""
+        result = ErrorRecoveryStrategies.skip_row_recovery(
+            ValueError("bad row"), row_number=5
         )
 
-        assert handler.should_retry(error) is True
+        assert result.success is True
+        assert result.skipped_count == 1
 
     @pytest.mark.unit
-    def test_should_retry_non_recoverable_error(self):
-        """Test should_retry for non-recoverable error."""
-        handler = ErrorHandler()
-        error = ProcessingError(
-            error_id="ERR_123",
-            category=ErrorCategory.SYSTEM,
-            severity=ErrorSeverity.CRITICAL,
-            message="Test error",
-            is_recoverable=False,
+    def test_partial_data_recovery_salvages_fields(self):
+        """Test that partial_data_recovery recovers rows with valid fields."""
+        result = ErrorRecoveryStrategies.partial_data_recovery(
+            ValueError("bad field"),
+            row_number=5,
+            row_data={"id": 1, "name": None},
         )
 
-        assert handler.should_retry(error) is False
+        assert result.success is True
+        assert result.processed_count == 1
+        assert len(result.warnings) == 1
 
     @pytest.mark.unit
-    def test_should_retry_max_retries_reached(self):
-        """Test should_retry when max retries reached."""
-        handler = ErrorHandler()
-        error = ProcessingError(
-            error_id="ERR_123",
-            category=ErrorCategory.VALIDATION,
-            severity=ErrorSeverity.MEDIUM,
-            message="Test error",
-            is_recoverable=True,
-            retry_count=3,
-            max_retries=3,
+    def test_partial_data_recovery_fallback_failure(self):
+        """Test that partial_data_recovery fails when nothing is salvageable."""
+        result = ErrorRecoveryStrategies.partial_data_recovery(
+            ValueError("bad row"), row_number=5, row_data={"name": None}
         )
 
-        assert handler.should_retry(error) is False
+        assert result.success is False
+        assert result.failed_count == 1
 
     @pytest.mark.unit
-    def test_should_retry_critical_severity(self):
-        """Test should_retry for critical severity error."""
-        handler = ErrorHandler()
-        error = ProcessingError(
-            error_id="ERR_123",
-            category=ErrorCategory.SYSTEM,
-            severity=ErrorSeverity.CRITICAL,
-            message="Test error",
-            is_recoverable=True,
+    @pytest.mark.parametrize(
+        ("fallback_kwargs", "expected_success", "expected_failed"),
+        [
+            pytest.param(
+                {
+                    "return_value": ProcessingResult(
+                        success=True, processed_count=1
+                    )
+                },
+                True,
+                0,
+                id="fallback-succeeds",
+            ),
+            pytest.param(
+                {"side_effect": RuntimeError("down")},
+                False,
+                1,
+                id="fallback-raises",
+            ),
+        ],
+    )
+    async def test_fallback_processing_recovery(
+        self, fallback_kwargs, expected_success, expected_failed
+    ):
+        """Test fallback_processing_recovery for succeeding and raising fallbacks."""
+        fallback = AsyncMock(**fallback_kwargs)
+
+        result = await ErrorRecoveryStrategies.fallback_processing_recovery(
+            ValueError("bad row"), row_number=5, fallback_func=fallback
         )
 
-        assert handler.should_retry(error) is False
+        assert result.success is expected_success
+        assert result.failed_count == expected_failed
+        fallback.assert_awaited_once_with(5)
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_handle_error_with_retry(self):
-        """Test handle_error with successful retry."""
-        handler = ErrorHandler(max_retries=3, retry_delay=0.1)
-        error = ValueError("Test error")
+    async def test_fallback_processing_recovery_shares_error_objects(self):
+        """Test that identical fallback failures reuse one error object."""
+        fallback = AsyncMock(side_effect=RuntimeError("down"))
+
+        first = await ErrorRecoveryStrategies.fallback_processing_recovery(
+            ValueError("bad row"), row_number=5, fallback_func=fallback
+        )
+        second = await ErrorRecoveryStrategies.fallback_processing_recovery(
+            ValueError("bad row"), row_number=6, fallback_func=fallback
+        )
+
+        assert first.success is False
+        assert first.errors[0] is second.errors[0]
+        assert first.errors[0].error_id.startswith("FALLBACK_")
+
+
+@pytest.fixture
+def frozen_time_ns(monkeypatch):
+    """Pin the recovery module's clock to 2024-01-01T00:00:00Z.
+
+    Checkpoint content becomes exactly comparable instead of only
+    pattern-checkable, and the tests skip the real clock reads.
+    """
+    ns = 1_704_067_200_000_000_000
+    monkeypatch.setattr(
+        "async_aws_lambda.errors.recovery.time.time_ns", lambda: ns
+    )
+    return ns
+
+
+@pytest.fixture(scope="module")
+def recovery():
+    """Shared default PartialProcessingRecovery for pure-method tests.
 
-        retry_func = AsyncMock()
-        retry_func.return_value = None
+    Only tests that never mutate checkpoint state may use this; mutating
+    tests build their own instance.
+    """
+    return PartialProcessingRecovery()
 
-        processing_error = await handler.handle_error(error, retry_func=retry_func)
 
-        assert processing_error.retry_count > 0
-        retry_func.assert_called()
+@pytest.fixture
+def recovery_with_interval(request):
+    """PartialProcessingRecovery with the checkpoint_interval param."""
+    return PartialProcessingRecovery(checkpoint_interval=request.param)
+
+
+class TestPartialProcessingRecovery:
+    """Tests for PartialProcessingRecovery."""
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_handle_error_tracks_error_counts(self):
-        """Test that handle_error tracks error counts."""
-        handler = ErrorHandler()
-        error = ValueError("Test error")
+    @pytest.mark.parametrize("recovery_with_interval", [100], indirect=True)
+    def test_should_create_checkpoint_on_interval(self, recovery_with_interval):
+        """Test that checkpoints are due every checkpoint_interval rows."""
+        assert recovery_with_interval.should_create_checkpoint(100) is True
+        assert recovery_with_interval.should_create_checkpoint(200) is True
+        assert recovery_with_interval.should_create_checkpoint(150) is False
 
-        await handler.handle_error(error)
+    @pytest.mark.unit
+    @pytest.mark.parametrize("recovery_with_interval", [128], indirect=True)
+    def test_should_create_checkpoint_power_of_two_interval(
+        self, recovery_with_interval
+    ):
+        """Test that power-of-two intervals checkpoint on the same rows."""
+        assert recovery_with_interval.should_create_checkpoint(128) is True
+        assert recovery_with_interval.should_create_checkpoint(256) is True
+        assert recovery_with_interval.should_create_checkpoint(129) is False
 
-        assert ErrorCategory.VALIDATION in handler.error_counts
-        assert handler.error_counts[ErrorCategory.VALIDATION] == 1
+    @pytest.mark.unit
+    def test_checkpoint_interval_must_be_positive(self):
+        """Test that a non-positive checkpoint_interval is rejected."""
+        with pytest.raises(ValueError, match="checkpoint_interval"):
+            PartialProcessingRecovery(checkpoint_interval=0)
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_handle_error_tracks_critical_errors(self):
-        """Test that handle_error tracks critical errors."""
-        handler = ErrorHandler()
-        error = PermissionError("Permission denied")
+    def test_create_checkpoint_records_progress(self, frozen_time_ns):
+        """Test that create_checkpoint records the processing state."""
+        recovery = PartialProcessingRecovery(checkpoint_interval=100)
 
-        await handler.handle_error(error)
+        checkpoint = recovery.create_checkpoint(
+            row_number=100, processed_count=95, failed_count=5
+        )
 
-        assert len(handler.critical_errors) == 1
-        assert handler.critical_errors[0].severity == ErrorSeverity.CRITICAL
+        assert checkpoint["row_number"] == 100
+        assert checkpoint["processed_count"] == 95
+        assert checkpoint["failed_count"] == 5
+        assert checkpoint["timestamp_ns"] == frozen_time_ns
+        assert checkpoint["checkpoint_id"] == "CP_1704067200_100"
+        assert recovery.latest_checkpoint() == checkpoint
 
     @pytest.mark.unit
-    def test_get_error_summary(self):
-        """Test get_error_summary."""
-        handler = ErrorHandler()
-        handler.error_counts = {
-            ErrorCategory.VALIDATION: 5,
-            ErrorCategory.NETWORK: 2,
-        }
-        handler.critical_errors = [
-            ProcessingError(
-                error_id="ERR_123",
-                category=ErrorCategory.SYSTEM,
-                severity=ErrorSeverity.CRITICAL,
-                message="Critical error",
-            )
-        ]
+    def test_latest_checkpoint_empty(self, recovery):
+        """Test that latest_checkpoint is None before any checkpoint."""
+        assert recovery.latest_checkpoint() is None
 
-        summary = handler.get_error_summary()
+    @pytest.mark.unit
+    async def test_background_flusher_persists_batches(self):
+        """Test that enqueued checkpoints reach the persist callable."""
+        persisted = []
 
-        assert summary["total_errors"] == 7
-        assert summary["error_counts_by_category"]["validation"] == 5
-        assert summary["error_counts_by_category"]["network"] == 2
-        assert summary["critical_errors"] == 1
+        async def persist(batch):
+            persisted.extend(batch)
+
+        recovery = PartialProcessingRecovery(
+            checkpoint_interval=1, persist=persist, flush_interval=0.01
+        )
+        await recovery.start()
+
+        recovery.create_checkpoint(row_number=1, processed_count=1, failed_count=0)
+        recovery.create_checkpoint(row_number=2, processed_count=2, failed_count=0)
+
+        await recovery.drain()
+
+        assert len(persisted) == 2
+        assert persisted[0]["row_number"] == 1
+
+    @pytest.mark.unit
+    async def test_start_requires_persist_callable(self):
+        """Test that start raises without a persist callable."""
+        # Fresh instance: a successful start would mutate shared state
+        recovery = PartialProcessingRecovery()
+
+        with pytest.raises(RuntimeError, match="persist"):
+            await recovery.start()
+
+    @pytest.mark.unit
+    def test_checkpoint_timestamp_iso(self, frozen_time_ns):
+        """Test that checkpoint timestamps materialize as ISO strings."""
+        recovery = PartialProcessingRecovery()
+        checkpoint = recovery.create_checkpoint(
+            row_number=1, processed_count=1, failed_count=0
+        )
+
+        iso = checkpoint_timestamp_iso(checkpoint)
+
+        assert iso == "2024-01-01T00:00:00+00:00"
+
+    @pytest.mark.unit
+    def test_checkpoint_binary_roundtrip(self):
+        """Test that checkpoints survive the binary serialization roundtrip."""
+        recovery = PartialProcessingRecovery()
+        checkpoint = recovery.create_checkpoint(
+            row_number=42, processed_count=40, failed_count=2
+        )
+
+        packed = serialize_checkpoint(checkpoint)
+
+        assert len(packed) == 32
+        assert deserialize_checkpoint(packed) == checkpoint
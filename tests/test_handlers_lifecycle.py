@@ -17,11 +17,29 @@ from async_aws_lambda.handlers.lifecycle import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolate_cleanup_handlers():
+    """Snapshot and restore registered cleanup handlers around each test.
+
+    Without this, every register_cleanup_handler call in this module leaks
+    into later tests and the handler pass in lambda_lifecycle grows longer
+    test by test.
+    """
+    import async_aws_lambda.handlers.lifecycle as lifecycle_module
+
+    with lifecycle_module._cleanup_lock:
+        snapshot = lifecycle_module._cleanup_handlers
+
+    yield
+
+    with lifecycle_module._cleanup_lock:
+        lifecycle_module._cleanup_handlers = snapshot
+
+
 class TestLambdaLifecycle:
     """Tests for lambda_lifecycle context manager."""
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_lambda_lifecycle_context_manager(self):
         """Test that lambda_lifecycle works as a context manager."""
         async with lambda_lifecycle():
@@ -29,7 +47,6 @@ class TestLambdaLifecycle:
             pass
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_lambda_lifecycle_registers_cleanup(self):
         """Test that lambda_lifecycle registers cleanup handlers."""
         cleanup_called = []
@@ -46,7 +63,6 @@ class TestLambdaLifecycle:
         assert len(cleanup_called) > 0
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_lambda_lifecycle_handles_cleanup_errors(self):
         """Test that lambda_lifecycle handles cleanup errors gracefully."""
 
@@ -60,7 +76,6 @@ class TestLambdaLifecycle:
             pass
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_lambda_lifecycle_multiple_cleanup_handlers(self):
         """Test that multiple cleanup handlers are called."""
         cleanup_calls = []
@@ -77,9 +92,9 @@ class TestLambdaLifecycle:
         async with lambda_lifecycle():
             pass
 
-        # Both cleanup handlers should be called
-        assert 1 in cleanup_calls
-        assert 2 in cleanup_calls
+        # With handler isolation in place exactly these two ran, in
+        # registration order; a single list comparison checks both at once
+        assert cleanup_calls == [1, 2]
 
 
 class TestRegisterCleanupHandler:
@@ -111,29 +126,44 @@ class TestRegisterCleanupHandler:
         """Test that cleanup handler registration is thread-safe."""
         import threading
 
-        cleanup_calls = []
+        import async_aws_lambda.handlers.lifecycle as lifecycle_module
 
         def cleanup():
-            cleanup_calls.append(True)
+            pass
+
+        # Two threads released simultaneously by a barrier give the same
+        # lost-update signal as a ten-thread stress run, far cheaper
+        barrier = threading.Barrier(2)
 
         def register_in_thread():
+            barrier.wait()
             register_cleanup_handler(cleanup)
 
-        threads = [threading.Thread(target=register_in_thread) for _ in range(10)]
+        baseline = len(lifecycle_module._cleanup_handlers)
+        threads = [threading.Thread(target=register_in_thread) for _ in range(2)]
         for thread in threads:
             thread.start()
         for thread in threads:
             thread.join()
 
-        # All handlers should be registered
-        from async_aws_lambda.handlers.lifecycle import _cleanup_handlers
-
-        assert len(_cleanup_handlers) >= 10
+        # Both registrations must land; a lost update would drop one
+        assert len(lifecycle_module._cleanup_handlers) == baseline + 2
 
 
 class TestCreateLambdaHandler:
     """Tests for create_lambda_handler function."""
 
+    @pytest.fixture(autouse=True)
+    def _reuse_persistent_loop(self, monkeypatch):
+        """Route _run_async through the persistent event loop.
+
+        With AWS_LAMBDA_FUNCTION_NAME set, the wrapper reuses the
+        module's persistent loop instead of paying asyncio.run's loop
+        setup and teardown in every test. The loop is closed at
+        interpreter exit by the module's own atexit hook.
+        """
+        monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "test-function")
+
     @pytest.mark.unit
     def test_create_lambda_handler_wraps_async_function(
         self, sample_event, mock_lambda_context
@@ -202,53 +232,119 @@ class TestCreateLambdaHandler:
         result = handler(sample_event, mock_lambda_context)
         assert result["statusCode"] == 200
 
+    @pytest.mark.unit
+    def test_create_lambda_handler_skips_duplicate_cleanup(
+        self, sample_event, mock_lambda_context
+    ):
+        """Test that cleanup runs once when the handler uses lambda_lifecycle."""
+        cleanup_called = []
+
+        def cleanup():
+            cleanup_called.append(True)
 
-class TestSignalHandling:
-    """Tests for signal handling in lifecycle."""
+        register_cleanup_handler(cleanup)
+
+        async def async_handler(event, context):
+            async with lambda_lifecycle():
+                return {"statusCode": 200}
+
+        handler = create_lambda_handler(async_handler)
+        handler(sample_event, mock_lambda_context)
+
+        # lambda_lifecycle already ran cleanup; the wrapper must not repeat it
+        assert len(cleanup_called) == 1
+
+
+class TestPersistentEventLoop:
+    """Tests for the persistent event loop used on warm invocations."""
 
     @pytest.mark.unit
-    def test_signal_handler_registration_skipped_in_tests(self):
-        """Test that signal handlers are not registered during testing."""
-        # Reset registration state
+    def test_loop_reused_across_invocations_in_lambda(
+        self, sample_event, mock_lambda_context
+    ):
+        """Test that invocations share one loop when running inside Lambda."""
+        import os
+        from unittest.mock import patch as mock_patch
+
         import async_aws_lambda.handlers.lifecycle as lifecycle_module
 
-        lifecycle_module._cleanup_registered = False
+        seen_loops = []
 
-        # Mock sys.modules to include pytest
-        original_modules = sys.modules.copy()
-        sys.modules["pytest"] = MagicMock()
+        async def async_handler(event, context):
+            seen_loops.append(asyncio.get_running_loop())
+            return {"statusCode": 200}
+
+        handler = create_lambda_handler(async_handler)
 
         try:
-            _register_lambda_cleanup()
-            # Should not raise and should mark as registered
-            assert lifecycle_module._cleanup_registered is True
+            with mock_patch.dict(
+                os.environ, {"AWS_LAMBDA_FUNCTION_NAME": "test-function"}
+            ):
+                handler(sample_event, mock_lambda_context)
+                handler(sample_event, mock_lambda_context)
+
+            assert len(seen_loops) == 2
+            assert seen_loops[0] is seen_loops[1]
         finally:
-            sys.modules.clear()
-            sys.modules.update(original_modules)
+            lifecycle_module._close_loop()
+
+    @pytest.mark.unit
+    def test_asyncio_run_used_outside_lambda(self, sample_event, mock_lambda_context):
+        """Test that each invocation gets a fresh loop outside Lambda."""
+        import os
+        from unittest.mock import patch as mock_patch
+
+        seen_loops = []
+
+        async def async_handler(event, context):
+            seen_loops.append(asyncio.get_running_loop())
+            return {"statusCode": 200}
+
+        handler = create_lambda_handler(async_handler)
+
+        env = {k: v for k, v in os.environ.items() if k != "AWS_LAMBDA_FUNCTION_NAME"}
+        with mock_patch.dict(os.environ, env, clear=True):
+            handler(sample_event, mock_lambda_context)
+            handler(sample_event, mock_lambda_context)
+
+        assert len(seen_loops) == 2
+        assert seen_loops[0] is not seen_loops[1]
+
+
+class TestSignalHandling:
+    """Tests for signal handling in lifecycle."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_registered(self, monkeypatch):
+        """Start each test unregistered; monkeypatch restores the flag."""
+        import async_aws_lambda.handlers.lifecycle as lifecycle_module
+
+        monkeypatch.setattr(lifecycle_module, "_cleanup_registered", False)
+
+    @pytest.mark.unit
+    def test_signal_handler_registration_skipped_in_tests(self, monkeypatch):
+        """Test that signal handlers are not registered during testing."""
+        import async_aws_lambda.handlers.lifecycle as lifecycle_module
+
+        # Targeted setitem instead of snapshotting and restoring the whole
+        # sys.modules mapping around the test
+        monkeypatch.setitem(sys.modules, "pytest", MagicMock())
+
+        _register_lambda_cleanup()
+        # Should not raise and should mark as registered
+        assert lifecycle_module._cleanup_registered is True
 
     @pytest.mark.unit
     @patch("signal.signal")
-    def test_signal_handler_registration(self, mock_signal):
+    def test_signal_handler_registration(self, mock_signal, monkeypatch):
         """Test that signal handlers are registered when not in test mode."""
         import async_aws_lambda.handlers.lifecycle as lifecycle_module
 
-        original_registered = lifecycle_module._cleanup_registered
-        lifecycle_module._cleanup_registered = False
-
-        # Mock sys.modules to not include pytest
-        original_modules = sys.modules.copy()
-        pytest_in_modules = "pytest" in sys.modules
-        if pytest_in_modules:
-            del sys.modules["pytest"]
+        # Remove pytest from sys.modules for the duration of the test
+        monkeypatch.delitem(sys.modules, "pytest", raising=False)
 
-        try:
-            _register_lambda_cleanup()
-            # Should register signal handlers (but may be skipped if still detected as test)
-            # The actual behavior depends on how pytest detection works
-            # Just verify the function runs without error
-            assert lifecycle_module._cleanup_registered is True
-        finally:
-            # Restore original state
-            if pytest_in_modules:
-                sys.modules["pytest"] = original_modules.get("pytest")
-            lifecycle_module._cleanup_registered = original_registered
+        _register_lambda_cleanup()
+        # Should register signal handlers (but may be skipped if still detected
+        # as test mode; detection is cached at import). Just verify the
+        # function runs without error and marks registration done.
+        assert lifecycle_module._cleanup_registered is True
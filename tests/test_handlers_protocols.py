@@ -39,8 +39,7 @@ class TestAsyncLambdaHandlerProtocol:
     """Tests for AsyncLambdaHandler protocol."""
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_async_lambda_handler_protocol_implementation(self):
+    def test_async_lambda_handler_protocol_implementation(self):
         """Test that an async function implementing AsyncLambdaHandler protocol is recognized."""
 
         async def handler(event, context):
@@ -49,8 +48,7 @@ class TestAsyncLambdaHandlerProtocol:
         assert isinstance(handler, AsyncLambdaHandler)
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_async_lambda_handler_protocol_runtime_check(self):
+    def test_async_lambda_handler_protocol_runtime_check(self):
         """Test runtime checkable protocol."""
 
         class CustomAsyncHandler:
@@ -65,8 +63,7 @@ class TestDatabaseFactoryProtocol:
     """Tests for DatabaseFactory protocol."""
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_database_factory_protocol_implementation(self):
+    def test_database_factory_protocol_implementation(self):
         """Test that a function implementing DatabaseFactory protocol is recognized."""
 
         async def factory():
@@ -75,8 +72,7 @@ class TestDatabaseFactoryProtocol:
         assert isinstance(factory, DatabaseFactory)
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_database_factory_protocol_runtime_check(self):
+    def test_database_factory_protocol_runtime_check(self):
         """Test runtime checkable protocol."""
 
         class CustomFactory:
@@ -0,0 +1,217 @@
+"""
+Tests for the Lambda entry-point router.
+"""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from async_aws_lambda.utils import router
+
+
+@pytest.fixture(autouse=True)
+def reset_handler_cache():
+    """Reset the resolved-handler cache before and after each test."""
+    router._HANDLER_CACHE.clear()
+    yield
+    router._HANDLER_CACHE.clear()
+
+
+@pytest.fixture(scope="module")
+def _handler_module_base():
+    """One mock handler module shared by the whole file.
+
+    spec=["handler"] prunes the auto-generated dunder children that make
+    up most of a bare MagicMock's construction cost.
+    """
+    module = MagicMock(spec=["handler"])
+    module.handler = MagicMock(return_value={"statusCode": 200})
+    return module
+
+
+@pytest.fixture
+def handler_module(_handler_module_base):
+    """Hand out the shared mock handler module, resetting call state after."""
+    yield _handler_module_base
+    _handler_module_base.handler.reset_mock()
+
+
+@pytest.fixture
+def import_module_mock(monkeypatch):
+    """Swap importlib.import_module for a MagicMock.
+
+    monkeypatch installs and restores the attribute once per test, cheaper
+    than a patch decorator re-entering its machinery per method.
+    """
+    mock = MagicMock()
+    monkeypatch.setattr("importlib.import_module", mock)
+    return mock
+
+
+class TestRouterDispatch:
+    """Tests for router.handler dispatch."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("env", "expected_module"),
+        [
+            pytest.param(
+                {"LAMBDA_FUNCTION_ID": "process_orders"},
+                "handlers.process_orders",
+                id="default-package",
+            ),
+            pytest.param(
+                {
+                    "LAMBDA_FUNCTION_ID": "process_orders",
+                    "LAMBDA_HANDLER_PACKAGE": "fns",
+                },
+                "fns.process_orders",
+                id="custom-package",
+            ),
+        ],
+    )
+    def test_handler_dispatches_to_function_module(
+        self,
+        import_module_mock,
+        handler_module,
+        monkeypatch,
+        sample_event,
+        mock_lambda_context,
+        env,
+        expected_module,
+    ):
+        """Test that handler imports and calls the configured module."""
+        import_module_mock.return_value = handler_module
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        result = router.handler(sample_event, mock_lambda_context)
+
+        assert result == {"statusCode": 200}
+        import_module_mock.assert_called_once_with(expected_module)
+
+    @pytest.mark.unit
+    def test_handler_requires_function_id(
+        self, monkeypatch, sample_event, mock_lambda_context
+    ):
+        """Test that handler raises without LAMBDA_FUNCTION_ID."""
+        monkeypatch.delenv("LAMBDA_FUNCTION_ID", raising=False)
+
+        with pytest.raises(RuntimeError, match="LAMBDA_FUNCTION_ID"):
+            router.handler(sample_event, mock_lambda_context)
+
+    @pytest.mark.unit
+    def test_handler_rejects_module_without_handler(
+        self, import_module_mock, monkeypatch, sample_event, mock_lambda_context
+    ):
+        """Test that handler raises for a module without a handler attribute."""
+        import_module_mock.return_value = MagicMock(spec=[])
+        monkeypatch.setenv("LAMBDA_FUNCTION_ID", "process_orders")
+
+        with pytest.raises(AttributeError, match="handler"):
+            router.handler(sample_event, mock_lambda_context)
+
+
+class TestRouterFastPaths:
+    """Tests for the sys.modules fast path and pre-warming."""
+
+    @pytest.mark.unit
+    def test_handler_prefers_already_imported_module(
+        self,
+        import_module_mock,
+        handler_module,
+        monkeypatch,
+        sample_event,
+        mock_lambda_context,
+    ):
+        """Test that an already-imported handler module skips importlib."""
+        monkeypatch.setenv("LAMBDA_FUNCTION_ID", "process_orders")
+
+        with patch.dict(sys.modules, {"handlers.process_orders": handler_module}):
+            result = router.handler(sample_event, mock_lambda_context)
+
+        assert result == {"statusCode": 200}
+        import_module_mock.assert_not_called()
+
+    @pytest.mark.unit
+    def test_prewarm_populates_handler_cache(
+        self, import_module_mock, handler_module, monkeypatch
+    ):
+        """Test that pre-warming resolves the listed function ids."""
+        import_module_mock.return_value = handler_module
+        monkeypatch.setenv("LAMBDA_PREWARM_FUNCTION_IDS", "one, two")
+
+        router._prewarm_from_env()
+
+        assert set(router._HANDLER_CACHE) == {"one", "two"}
+
+    @pytest.mark.unit
+    def test_prewarm_defers_failures_to_dispatch(self, import_module_mock, monkeypatch):
+        """Test that a failing pre-warm import is logged, not raised."""
+        import_module_mock.side_effect = ImportError("missing")
+        monkeypatch.setenv("LAMBDA_PREWARM_FUNCTION_IDS", "broken")
+
+        router._prewarm_from_env()
+
+        assert "broken" not in router._HANDLER_CACHE
+
+
+class TestRouterValidation:
+    """Tests for handler validation at resolution time."""
+
+    @pytest.mark.unit
+    def test_handler_rejects_non_callable_handler(
+        self, import_module_mock, monkeypatch, sample_event, mock_lambda_context
+    ):
+        """Test that handler raises for a non-callable handler attribute."""
+        module = MagicMock()
+        module.handler = "not-callable"
+        import_module_mock.return_value = module
+        monkeypatch.setenv("LAMBDA_FUNCTION_ID", "process_orders")
+
+        with pytest.raises(TypeError, match="not callable"):
+            router.handler(sample_event, mock_lambda_context)
+
+
+class TestRouterCache:
+    """Tests for the per-function handler cache."""
+
+    @pytest.mark.unit
+    def test_handler_cached_across_invocations(
+        self,
+        import_module_mock,
+        handler_module,
+        monkeypatch,
+        sample_event,
+        mock_lambda_context,
+    ):
+        """Test that warm invocations skip module resolution."""
+        import_module_mock.return_value = handler_module
+        monkeypatch.setenv("LAMBDA_FUNCTION_ID", "process_orders")
+
+        router.handler(sample_event, mock_lambda_context)
+        router.handler(sample_event, mock_lambda_context)
+
+        # Module resolution should only happen on the first dispatch
+        import_module_mock.assert_called_once()
+
+    @pytest.mark.unit
+    def test_handler_cached_per_function_id(
+        self,
+        import_module_mock,
+        handler_module,
+        monkeypatch,
+        sample_event,
+        mock_lambda_context,
+    ):
+        """Test that different function ids resolve independently."""
+        import_module_mock.return_value = handler_module
+
+        monkeypatch.setenv("LAMBDA_FUNCTION_ID", "one")
+        router.handler(sample_event, mock_lambda_context)
+        monkeypatch.setenv("LAMBDA_FUNCTION_ID", "two")
+        router.handler(sample_event, mock_lambda_context)
+
+        assert import_module_mock.call_count == 2
+        assert set(router._HANDLER_CACHE) == {"one", "two"}